@@ -1,7 +1,7 @@
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from ..services.auth_service import verify_token
-from ..core.database import get_database, get_redis
+from ..core.exceptions import AuthenticationError
 from ..services.movie_service import movie_service
 from typing import Optional
 from loguru import logger
@@ -14,33 +14,16 @@ async def get_current_user_id(
     """
     Get current user ID from JWT token
     """
-    token = credentials.credentials
-    result = await verify_token(token)
-    
-    # Handle tuple return value (is_valid, payload) from auth_service.verify_token
-    if isinstance(result, tuple) and len(result) == 2:
-        is_valid, payload = result
-        if not is_valid:
-            logger.error(f"Token verification failed: {payload.get('error', 'Unknown error')}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid authentication credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-        # If valid, use the payload
-        payload = result[1]
-    else:
-        # Direct payload return from core.auth.verify_token
-        payload = result
-    
-    if not payload or "sub" not in payload:
+    try:
+        payload = await verify_token(credentials.credentials)
+        return payload["sub"]
+    except (AuthenticationError, KeyError) as e:
+        logger.opt(lazy=True).error("Token verification failed: {}", lambda: str(e))
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    
-    return payload["sub"]
 
 async def get_optional_user_id(
     request: Request
@@ -52,29 +35,19 @@ async def get_optional_user_id(
     if not auth_header or not auth_header.startswith("Bearer "):
         return None
         
-    token = auth_header.replace("Bearer ", "")
+    token = auth_header[7:]  # Strip the "Bearer " prefix checked above
     try:
-        result = await verify_token(token)
-        
-        # Handle tuple return value (is_valid, payload) from auth_service.verify_token
-        if isinstance(result, tuple) and len(result) == 2:
-            is_valid, payload = result
-            if not is_valid:
-                return None
-            # If valid, use the payload
-            payload = result[1]
-        else:
-            # Direct payload return from core.auth.verify_token
-            payload = result
-            
-        if payload and "sub" in payload:
-            return payload["sub"]
-    except:
-        pass
-        
-    return None
+        payload = await verify_token(token)
+        return payload.get("sub")
+    except AuthenticationError:
+        return None
+
+# Shared dependency markers, so every endpoint resolves the user through the
+# same Depends object and FastAPI's per-request cache decodes the token once
+CurrentUserId = Depends(get_current_user_id)
+OptionalUserId = Depends(get_optional_user_id)
 
-def get_movie_service():
+async def get_movie_service():
     """
     Dependency for getting the movie service
     """
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException, Depends, Path, Query, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Path, Query, status
+from fastapi.responses import ORJSONResponse
 from typing import Dict, Any
 from ...models.auth import UserCreate, UserLogin, AuthResponse, RegisterResponse
 from ...services import auth_service, pipeline_trigger_service
@@ -9,8 +10,17 @@ from app.services.auth_service import get_user_details
 router = APIRouter()
 
 
+async def _trigger_data_pipeline_safely(user_id: str, email: str):
+    """Trigger the data pipeline, logging instead of raising on failure"""
+    try:
+        await pipeline_trigger_service.trigger_data_pipeline(user_id, email)
+    except Exception as e:
+        # Log error but don't fail the registration
+        logger.error(f"Failed to trigger data pipeline: {str(e)}")
+
+
 @router.post("/register", response_model=RegisterResponse, status_code=status.HTTP_201_CREATED)
-async def register(user: UserCreate):
+async def register(user: UserCreate, background_tasks: BackgroundTasks):
     """
     Register a new user
     
@@ -38,13 +48,9 @@ async def register(user: UserCreate):
     # Extract user ID from result
     user_id = result.get("id", "unknown")
     
-    # Trigger the data pipeline asynchronously
+    # Trigger the data pipeline once the response has been sent
     # We do this after successful registration but don't wait for its completion
-    try:
-        await pipeline_trigger_service.trigger_data_pipeline(user_id, user.email)
-    except Exception as e:
-        # Log error but don't fail the registration
-        logger.error(f"Failed to trigger data pipeline: {str(e)}")
+    background_tasks.add_task(_trigger_data_pipeline_safely, user_id, user.email)
     
     # Return success response
     return RegisterResponse(
@@ -82,7 +88,7 @@ async def login(user: UserLogin):
         user=user_info
     )
 
-@router.get("/verify", response_model=Dict[str, Any])
+@router.get("/verify", response_model=None, response_class=ORJSONResponse)
 async def verify_auth(current_user: Dict[str, Any] = Depends(get_current_user)):
     """
     Verify if the current authentication token is valid.
@@ -91,20 +97,21 @@ async def verify_auth(current_user: Dict[str, Any] = Depends(get_current_user)):
     try:
         # The fact that we reached this point means the token is valid
         # We can return basic user info
-        return {
+        return ORJSONResponse({
             "isAuthenticated": True,
             "user": {
                 "id": current_user.get("user_id"),
                 "email": current_user.get("email")
             }
-        }
-    except Exception as e:
+        })
+    except Exception:
+        logger.exception("Error verifying authentication")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error verifying authentication: {str(e)}"
+            detail="Error verifying authentication"
         )
 
-@router.get("/me", response_model=Dict[str, Any])
+@router.get("/me", response_model=None, response_class=ORJSONResponse)
 async def get_current_user_info(current_user: Dict[str, Any] = Depends(get_current_user)):
     """
     Get detailed information about the current authenticated user.
@@ -114,13 +121,14 @@ async def get_current_user_info(current_user: Dict[str, Any] = Depends(get_curre
         user_details = await get_user_details(current_user["user_id"])
         
         # Merge with token info and return
-        return {
+        return ORJSONResponse({
             "id": current_user["user_id"],
             "email": current_user.get("email", ""),
             **user_details
-        }
-    except Exception as e:
+        })
+    except Exception:
+        logger.exception("Error fetching user details")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching user details: {str(e)}"
+            detail="Error fetching user details"
         ) 
\ No newline at end of file
@@ -1,24 +1,71 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse, Response
 from ...core.database import get_database, get_redis
-from motor.motor_asyncio import AsyncIOMotorClient
-import redis
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+import asyncio
 import time
 import platform
-import os
 from ...core.config import settings
 
 
 router = APIRouter()
 
+# System details are constant for the lifetime of the process
+_SYSTEM_INFO = {
+    "python_version": platform.python_version(),
+    "platform": platform.platform()
+}
 
-@router.get("")
-async def health_check() -> Dict[str, Any]:
-    """
-    Health check endpoint to verify API and dependencies are working.
-    Returns status of database connections and basic system info.
-    """
-    start_time = time.time()
+# Upper bound on how long a health probe waits for MongoDB
+MONGODB_HEALTH_TIMEOUT_SECONDS = 0.5
+
+# Seconds a health payload is reused before dependencies are pinged again
+HEALTH_CACHE_TTL_SECONDS = 2.0
+
+# Last health payload as (monotonic time it was built, payload)
+_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_health_lock = asyncio.Lock()
+
+# Liveness probes only need to know the process is serving, so the body is encoded once
+_LIVE_BODY = b'{"status":"ok"}'
+
+
+async def check_mongodb_connection() -> Dict[str, Any]:
+    """Ping MongoDB and return its dependency status"""
+    try:
+        db = get_database()
+        # 'hello' is the cheapest server round trip; bound it so probes fail fast during an outage
+        await asyncio.wait_for(
+            db.command("hello"),
+            timeout=MONGODB_HEALTH_TIMEOUT_SECONDS
+        )
+        return {"status": "ok"}
+    except asyncio.TimeoutError:
+        return {"status": "error", "error": "MongoDB health check timed out"}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+async def check_redis_connection() -> Dict[str, Any]:
+    """Ping Redis and return its dependency status"""
+    redis_client = get_redis()
+    if not redis_client:
+        return {"status": "disabled"}
+    try:
+        await redis_client.ping()
+        return {"status": "ok"}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+def _get_cached_health() -> Optional[Dict[str, Any]]:
+    if _health_cache and time.monotonic() - _health_cache[0] < HEALTH_CACHE_TTL_SECONDS:
+        return _health_cache[1]
+    return None
+
+
+async def _build_health_data() -> Dict[str, Any]:
+    start_time = time.perf_counter()
     health_data = {
         "status": "ok",
         "version": "1.0.0",
@@ -28,37 +75,76 @@ async def health_check() -> Dict[str, Any]:
             "mongodb": {"status": "unknown"},
             "redis": {"status": "unknown"}
         },
-        "system": {
-            "python_version": platform.python_version(),
-            "platform": platform.platform()
-        }
+        "system": _SYSTEM_INFO
     }
     
-    # Check MongoDB connection
-    try:
-        db = get_database()
-        # Perform a simple operation to verify connection
-        await db.command("ping")
-        health_data["dependencies"]["mongodb"]["status"] = "ok"
-    except Exception as e:
-        health_data["dependencies"]["mongodb"]["status"] = "error"
-        health_data["dependencies"]["mongodb"]["error"] = str(e)
-        health_data["status"] = "degraded"  # MongoDB is critical, mark as degraded
+    # Check MongoDB and Redis concurrently
+    mongodb_status, redis_status = await asyncio.gather(
+        check_mongodb_connection(),
+        check_redis_connection()
+    )
+    health_data["dependencies"]["mongodb"] = mongodb_status
+    health_data["dependencies"]["redis"] = redis_status
     
-    # Check Redis connection
-    redis_client = get_redis()
-    if redis_client:
-        try:
-            redis_client.ping()
-            health_data["dependencies"]["redis"]["status"] = "ok"
-        except Exception as e:
-            health_data["dependencies"]["redis"]["status"] = "error"
-            health_data["dependencies"]["redis"]["error"] = str(e)
-            # Redis is not critical, app can work without it (just slower)
-    else:
-        health_data["dependencies"]["redis"]["status"] = "disabled"
+    if mongodb_status["status"] != "ok":
+        health_data["status"] = "degraded"  # MongoDB is critical, mark as degraded
+    # Redis is not critical, app can work without it (just slower)
     
     # Calculate response time
-    health_data["response_time_ms"] = round((time.time() - start_time) * 1000, 2)
+    health_data["response_time_ms"] = round((time.perf_counter() - start_time) * 1000, 2)
+    
+    return health_data
+
+
+@router.get("")
+async def health_check() -> Dict[str, Any]:
+    """
+    Health check endpoint to verify API and dependencies are working.
+    Returns status of database connections and basic system info.
     
-    return health_data 
\ No newline at end of file
+    The payload is cached for HEALTH_CACHE_TTL_SECONDS so frequent probes
+    don't ping MongoDB and Redis on every call.
+    """
+    global _health_cache
+    cached = _get_cached_health()
+    if cached is not None:
+        return cached
+    
+    async with _health_lock:
+        # Another probe may have refreshed the payload while we were waiting
+        cached = _get_cached_health()
+        if cached is not None:
+            return cached
+        
+        health_data = await _build_health_data()
+        _health_cache = (time.monotonic(), health_data)
+        return health_data
+
+
+
+@router.get("/live")
+async def liveness_check() -> Response:
+    """
+    Liveness probe. Never touches MongoDB or Redis so frequent probes stay cheap.
+    """
+    return Response(content=_LIVE_BODY, media_type="application/json")
+
+
+@router.get("/ready")
+async def readiness_check() -> ORJSONResponse:
+    """
+    Readiness probe. Returns 503 until MongoDB is reachable; Redis is reported
+    but, as in the full health check, isn't required to serve traffic.
+    """
+    mongodb_status, redis_status = await asyncio.gather(
+        check_mongodb_connection(),
+        check_redis_connection()
+    )
+    ready = mongodb_status["status"] == "ok"
+    return ORJSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ok" if ready else "unavailable",
+            "dependencies": {"mongodb": mongodb_status, "redis": redis_status}
+        }
+    )
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from ...services.interaction_service import interaction_service, InteractionServiceError
-from ...models.interaction import InteractionCreate, InteractionRead
-from ..deps import get_current_user_id
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from ...services.interaction_service import interaction_service
+from ...models.interaction import InteractionCreate
+from ...core.exceptions import InteractionServiceError
+from ..deps import CurrentUserId
 from loguru import logger
 
 router = APIRouter()
@@ -10,41 +10,37 @@ router = APIRouter()
 @router.post("")
 async def create_interaction(
     interaction: InteractionCreate,
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = CurrentUserId
 ):
     """
     Create a new interaction (rating, view) for the authenticated user
     """
     try:
-        logger.info(f"Creating interaction with user_id {user_id} and data: {interaction.dict()}")
+        logger.opt(lazy=True).debug(
+            "Creating interaction with user_id {} and data: {}",
+            lambda: user_id,
+            lambda: interaction.model_dump()
+        )
         
-        # Initialize response
-        result = None
+        result = await interaction_service.create_interaction(
+            user_id=user_id,
+            interaction_data=interaction
+        )
+        logger.opt(lazy=True).debug("Interaction created successfully: {}", lambda: result)
         
-        # Call interaction service
-        try:
-            result = await interaction_service.create_interaction(
-                user_id=user_id,
-                interaction_data=interaction
-            )
-            logger.info(f"Interaction created successfully: {result}")
-        except Exception as service_error:
-            logger.error(f"Error in interaction_service.create_interaction: {service_error}")
-            raise
-            
         return result
     except InteractionServiceError as e:
         logger.error(f"InteractionServiceError: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unhandled error in create_interaction: {str(e)}, type: {type(e)}")
-        raise HTTPException(status_code=500, detail=f"Error creating interaction: {str(e)}")
+    except Exception:
+        logger.exception("Unhandled error in create_interaction")
+        raise HTTPException(status_code=500, detail="Error creating interaction")
 
 @router.get("/me")
 async def get_my_interactions(
     skip: int = Query(0, ge=0, description="Number of interactions to skip"),
     limit: int = Query(20, ge=1, le=100, description="Maximum number of interactions to return"),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = CurrentUserId
 ):
     """
     Get interactions for the authenticated user
@@ -56,5 +52,6 @@ async def get_my_interactions(
             limit=limit
         )
         return interactions
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving interactions: {str(e)}") 
\ No newline at end of file
+    except Exception:
+        logger.exception("Error retrieving interactions")
+        raise HTTPException(status_code=500, detail="Error retrieving interactions") 
\ No newline at end of file
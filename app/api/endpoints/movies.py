@@ -1,9 +1,10 @@
-from fastapi import APIRouter, HTTPException, Depends, Query, Path
+from fastapi import APIRouter, HTTPException, Query, Path
 from typing import List, Dict, Any, Optional
 from ...services.movie_service import movie_service
 from ...models.movie import MovieResponse
-from ..deps import get_optional_user_id
+from ..deps import OptionalUserId
 from ...core.exceptions import MovieNotFoundError
+from loguru import logger
 import json
 
 router = APIRouter()
@@ -13,7 +14,7 @@ router = APIRouter()
 async def get_movies(
     skip: int = Query(0, ge=0, description="Number of movies to skip"),
     limit: int = Query(20, ge=1, le=100, description="Number of movies to return"),
-    user_id: Optional[str] = Depends(get_optional_user_id)
+    user_id: Optional[str] = OptionalUserId
 ):
     """
     Get a paginated list of movies
@@ -67,5 +68,6 @@ async def get_movie(
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error retrieving movie: {str(e)}") 
\ No newline at end of file
+    except Exception:
+        logger.exception("Error retrieving movie")
+        raise HTTPException(status_code=500, detail="Error retrieving movie") 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends, Path, Query
+from fastapi import APIRouter, HTTPException, Path, Query
 from typing import List, Dict, Any, Optional
 from ...core.auth import get_current_user
 from ...services.recommendation_service import recommendation_service
@@ -6,7 +6,7 @@ from ...services.movie_service import movie_service
 from ...core.config import settings
 from ...models.recommendation import UserRecommendationResponse, ItemRecommendationResponse
 from ...models.movie import MovieResponse
-from ..deps import get_current_user_id, get_optional_user_id
+from ..deps import CurrentUserId
 from loguru import logger
 
 router = APIRouter()
@@ -16,7 +16,7 @@ router = APIRouter()
 async def get_user_recommendations(
     limit: int = Query(10, ge=1, le=50, description="Number of recommendations to return"),
     exclude_seen: bool = Query(True, description="Whether to exclude movies the user has already seen"),
-    user_id: str = Depends(get_current_user_id)
+    user_id: str = CurrentUserId
 ):
     """
     Get personalized movie recommendations for the authenticated user
@@ -28,11 +28,18 @@ async def get_user_recommendations(
             exclude_seen=exclude_seen
         )
         return recommendations
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting recommendations: {str(e)}")
+    except Exception:
+        logger.exception("Error getting recommendations")
+        raise HTTPException(status_code=500, detail="Error getting recommendations")
 
 
-@router.get("/item/{movie_id}", response_model=ItemRecommendationResponse)
+# The service already builds the response models, so skip FastAPI's response
+# re-validation and only document the schema
+@router.get(
+    "/item/{movie_id}",
+    response_model=None,
+    responses={200: {"model": ItemRecommendationResponse}}
+)
 async def get_item_recommendations(
     movie_id: str = Path(..., description="Movie ID to get similar items for"),
     limit: int = Query(settings.RECOMMENDATIONS_LIMIT, ge=1, le=50, description="Number of recommendations to return")
@@ -58,9 +65,9 @@ async def get_item_recommendations(
             movieId=movie_id,
             similar_items=similar_movies
         )
-    except Exception as e:
-        logger.error(f"Error getting similar movies: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Error getting similar movies: {str(e)}")
+    except Exception:
+        logger.exception("Error getting similar movies")
+        raise HTTPException(status_code=500, detail="Error getting similar movies")
 
 
 @router.get("/popular")
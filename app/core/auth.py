@@ -1,10 +1,13 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
-from .config import settings
+from jose import jwk, jwt, JWTError
+from jose.backends.base import Key
+from .config import get_settings
+from .auth_cache import TokenCache
+from .http_client import get_http_client
 from loguru import logger
-import httpx
-import json
+import asyncio
+import time
 from typing import Dict, Optional, Any
 
 # Security scheme for JWT Bearer token
@@ -13,29 +16,92 @@ security = HTTPBearer()
 # Cache the JWKS data to avoid frequent network requests
 jwks_cache: Dict[str, Any] = {}
 
+# Verification keys built from the JWKS, indexed by their 'kid'
+jwks_keys_by_kid: Dict[Optional[str], Key] = {}
 
-async def get_jwks():
+# Serializes JWKS fetches so concurrent requests don't all hit Supabase
+_jwks_lock = asyncio.Lock()
+
+# Minimum seconds between forced JWKS refreshes for unknown key ids
+JWKS_REFRESH_INTERVAL_SECONDS = 10.0
+_jwks_fetched_at = 0.0
+
+# Recently verified token payloads, keyed on the token digest
+token_cache = TokenCache()
+
+
+async def get_jwks(force_refresh: bool = False):
     """
     Get JSON Web Key Set from Supabase for JWT verification
     Caches the JWKS data to avoid frequent network requests
+    
+    Args:
+        force_refresh: Re-fetch the JWKS (e.g. after key rotation), at most
+            once every JWKS_REFRESH_INTERVAL_SECONDS
     """
-    global jwks_cache
-    if jwks_cache:
+    global jwks_cache, jwks_keys_by_kid, _jwks_fetched_at
+    if jwks_cache and not force_refresh:
         return jwks_cache
     
-    try:
-        async with httpx.AsyncClient() as client:
-            jwks_url = f"{settings.SUPABASE_URL}/auth/v1/jwks"
+    async with _jwks_lock:
+        # Another request may have fetched the JWKS while we were waiting
+        if jwks_cache:
+            if not force_refresh:
+                return jwks_cache
+            if time.monotonic() - _jwks_fetched_at < JWKS_REFRESH_INTERVAL_SECONDS:
+                return jwks_cache
+        
+        try:
+            client = get_http_client()
+            jwks_url = f"{get_settings().SUPABASE_URL}/auth/v1/jwks"
             response = await client.get(jwks_url)
             response.raise_for_status()
-            jwks_cache = response.json()
+            jwks = response.json()
+            # Construct the key objects once instead of re-parsing the JWK on every request
+            jwks_keys_by_kid = {
+                key.get("kid"): jwk.construct(key, algorithm=key.get("alg", "RS256"))
+                for key in jwks.get("keys", [])
+            }
+            jwks_cache = jwks
+            _jwks_fetched_at = time.monotonic()
             return jwks_cache
-    except Exception as e:
-        logger.error(f"Failed to fetch JWKS: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Authentication service unavailable"
-        )
+        except Exception as e:
+            logger.error(f"Failed to fetch JWKS: {e}")
+            if jwks_cache:
+                # Keep serving the keys we already have
+                return jwks_cache
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Authentication service unavailable"
+            )
+
+
+async def get_signing_key(kid: Optional[str]) -> Key:
+    """
+    Get the JWKS key matching a token's 'kid' header
+    
+    Refreshes the JWKS once if the key id is unknown, since Supabase serves
+    new keys during rotation.
+    
+    Raises:
+        JWTError: If no key matches the key id
+    """
+    await get_jwks()
+    key = _lookup_signing_key(kid)
+    if key is None:
+        await get_jwks(force_refresh=True)
+        key = _lookup_signing_key(kid)
+    if key is None:
+        raise JWTError(f"No JWKS key found for kid {kid!r}")
+    return key
+
+
+def _lookup_signing_key(kid: Optional[str]) -> Optional[Key]:
+    key = jwks_keys_by_kid.get(kid)
+    if key is None and kid is None and len(jwks_keys_by_kid) == 1:
+        # Tokens without a 'kid' can only be matched against a single-key set
+        key = next(iter(jwks_keys_by_kid.values()))
+    return key
 
 
 async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, Any]:
@@ -45,20 +111,21 @@ async def verify_token(credentials: HTTPAuthorizationCredentials = Depends(secur
     token = credentials.credentials
     
     try:
-        # Get the JWKS to verify the token
-        jwks = await get_jwks()
-        
-        # For simplicity in this example, we're using the first key in JWKS
-        # A more robust implementation would select the key by 'kid' header in the JWT
-        public_key = jwks['keys'][0]
-        
-        # Decode and verify the token
-        payload = jwt.decode(
-            token,
-            key=json.dumps(public_key),
-            algorithms=["RS256"],
-            audience="authenticated"
-        )
+        payload = token_cache.get(token)
+        if payload is None:
+            # Select the signing key by the token's 'kid' header
+            kid = jwt.get_unverified_header(token).get("kid")
+            public_key = await get_signing_key(kid)
+            
+            # Decode and verify the token
+            payload = jwt.decode(
+                token,
+                key=public_key,
+                algorithms=["RS256"],
+                audience="authenticated"
+            )
+            if payload:
+                token_cache.set(token, payload)
         
         # Check if token is valid
         if not payload:
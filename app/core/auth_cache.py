@@ -0,0 +1,69 @@
+"""
+Short-lived cache for verified JWT payloads.
+
+Verifying a token signature on every request is the most expensive part of
+the auth path, so payloads are cached for a few seconds (never past the
+token's own expiry). Entries are keyed on the SHA-256 digest of the token so
+raw tokens are never kept in memory.
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+# Defaults for the verification cache
+TOKEN_CACHE_MAX_ENTRIES = 10_000
+TOKEN_CACHE_TTL_SECONDS = 5.0
+
+
+class TokenCache:
+    """Bounded LRU cache of decoded token payloads with a per-entry TTL"""
+
+    def __init__(self, maxsize: int = TOKEN_CACHE_MAX_ENTRIES, ttl: float = TOKEN_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Return the cached payload for a token, or None if missing or expired"""
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, payload = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, token: str, payload: Dict[str, Any]) -> None:
+        """Cache a verified payload until min(exp - now, ttl)"""
+        ttl = self.ttl
+        exp = payload.get("exp")
+        if exp is not None:
+            try:
+                ttl = min(ttl, float(exp) - time.time())
+            except (TypeError, ValueError):
+                return
+        if ttl <= 0:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (time.monotonic() + ttl, payload)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached payloads"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
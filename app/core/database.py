@@ -1,142 +1,305 @@
-from motor.motor_asyncio import AsyncIOMotorClient
-import redis
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorCollection, AsyncIOMotorDatabase
+import redis.asyncio as aioredis
+from redis.utils import HIREDIS_AVAILABLE
+import asyncio
+import random
 from loguru import logger
-from .config import settings
-import os
+from .config import get_settings
+from typing import Dict, Optional, Set
 
 
 # MongoDB
 mongodb_client: AsyncIOMotorClient = None
+_database: AsyncIOMotorDatabase = None
+_collections: Dict[str, AsyncIOMotorCollection] = {}
+
+# Fail fast instead of waiting on the driver's 30s default when the cluster is unreachable
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = 5000
+MONGODB_CONNECT_TIMEOUT_MS = 5000
+
+# Pool sizing; minPoolSize connections are opened in the background at startup so early requests skip the TLS handshake
+MONGODB_MAX_POOL_SIZE = 50
+MONGODB_MIN_POOL_SIZE = 10
+MONGODB_WAIT_QUEUE_TIMEOUT_MS = 2000
+
+# Startup work (pool warm-up, index builds) that runs off the cold-start path; cancelled on shutdown
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _run_in_background(coro) -> asyncio.Task:
+    """Start a startup task without awaiting it, keeping a reference until it finishes"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 async def connect_to_mongodb():
     """Connect to MongoDB Atlas"""
-    global mongodb_client
+    global mongodb_client, _database
+    # Keep a single shared client for the process
+    if mongodb_client is not None:
+        return
+    
+    settings = get_settings()
     try:
-        mongodb_client = AsyncIOMotorClient(settings.MONGODB_URI)
+        mongodb_client = AsyncIOMotorClient(
+            settings.MONGODB_URI,
+            serverSelectionTimeoutMS=MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=MONGODB_CONNECT_TIMEOUT_MS,
+            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+            minPoolSize=MONGODB_MIN_POOL_SIZE,
+            waitQueueTimeoutMS=MONGODB_WAIT_QUEUE_TIMEOUT_MS
+        )
+        # Fall back to the database named in the connection URI, as parsed by the driver
+        if settings.MONGODB_DB_NAME:
+            _database = mongodb_client[settings.MONGODB_DB_NAME]
+        else:
+            _database = mongodb_client.get_default_database("movielens")
+        _collections.clear()
         logger.info("Connected to MongoDB Atlas")
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB: {e}")
         raise
+    
+    # The client connects lazily; open the pool in the background instead of delaying startup
+    _run_in_background(_warm_mongodb_pool(_database))
+
+
+async def _warm_mongodb_pool(db: AsyncIOMotorDatabase):
+    """Open the minimum pool up front with concurrent pings"""
+    try:
+        await asyncio.gather(*(db.command("ping") for _ in range(MONGODB_MIN_POOL_SIZE)))
+    except Exception as e:
+        logger.warning("Could not warm MongoDB connection pool: {}", e)
 
 
 async def close_mongodb_connection():
     """Close MongoDB connection"""
-    global mongodb_client
+    global mongodb_client, _database
+    for task in list(_background_tasks):
+        task.cancel()
     if mongodb_client:
         mongodb_client.close()
         logger.info("MongoDB connection closed")
+    mongodb_client = None
+    _database = None
+    _collections.clear()
 
 
 def get_database():
     """Get MongoDB database instance"""
-    if not mongodb_client:
+    if _database is None:
         raise Exception("MongoDB client not initialized")
-    # Extract database name from connection URI - assumes standard MongoDB URI format
-    db_name = settings.MONGODB_DB_NAME or settings.MONGODB_URI.split("/")[-1].split("?")[0]
-    return mongodb_client[db_name]
+    return _database
+
+
+def get_collection(name: str) -> AsyncIOMotorCollection:
+    """Get a MongoDB collection handle, cached until the next (re)connect"""
+    collection = _collections.get(name)
+    if collection is None:
+        collection = _collections[name] = get_database()[name]
+    return collection
+
+
+# Indexes the repositories' queries rely on, as (collection, keys, index options)
+MONGODB_INDEXES = [
+    ("movies", [("title", "text")], {}),
+    ("interactions", [("user_id", 1), ("timestamp", -1)], {}),
+    # Covers get_user_movie_ids so it's answered from the index without fetching documents
+    ("interactions", [("user_id", 1), ("type", 1), ("movie_id", 1)], {"name": "user_type_movie_cov"}),
+]
+
+
+async def _create_index(db: AsyncIOMotorDatabase, collection: str, keys, options) -> None:
+    try:
+        await db[collection].create_index(keys, **options)
+    except Exception as e:
+        logger.warning("Could not create index {} on {}: {}", keys, collection, e)
+
+
+async def ensure_indexes():
+    """Create MongoDB indexes once at startup instead of on the request path"""
+    db = get_database()
+    await asyncio.gather(*(_create_index(db, collection, keys, options) for collection, keys, options in MONGODB_INDEXES))
+    logger.info("MongoDB indexes ensured")
+
+
+async def connect_to_datastores():
+    """Connect to MongoDB and Redis concurrently and start building indexes in the background"""
+    mongodb_result, redis_result = await asyncio.gather(
+        connect_to_mongodb(), init_redis(), return_exceptions=True
+    )
+    if isinstance(redis_result, Exception):
+        logger.error("Redis initialization failed: {}", redis_result)
+    if isinstance(mongodb_result, Exception):
+        raise mongodb_result
+    
+    # Index builds can take a while on large collections; serve requests in the meantime
+    _run_in_background(ensure_indexes())
 
 
 # Redis
 _redis_client = None
 _redis_connection_attempted = False  # Flag to track if we've already tried to connect
+_redis_lock = asyncio.Lock()
 
+# Connection settings for the shared Redis pool
+REDIS_MAX_CONNECTIONS = 20
+REDIS_LOCAL_CONNECT_TIMEOUT_SECONDS = 2.0
+REDIS_CONNECT_TIMEOUT_SECONDS = 5.0
+REDIS_PREWARM_CONNECTIONS = 2
+REDIS_LOCAL_PROBE_TIMEOUT_SECONDS = 0.2
+REDIS_RETRY_BASE_DELAY_SECONDS = 0.25
 
-async def init_redis():
-    """Initialize Redis connection."""
-    global _redis_client, _redis_connection_attempted
+
+def _create_redis_client(settings) -> Optional[aioredis.Redis]:
+    """Build a pooled Redis client from the configured settings, or None if Redis isn't configured"""
+    pool_options = {
+        "decode_responses": False,
+        "socket_connect_timeout": REDIS_CONNECT_TIMEOUT_SECONDS,
+        "max_connections": REDIS_MAX_CONNECTIONS,
+    }
     
-    # Don't attempt connection more than once
-    if _redis_connection_attempted:
-        return
+    # If REDIS_HOST starts with redis://, parse it as a URL
+    if settings.REDIS_HOST and settings.REDIS_HOST.startswith("redis://"):
+        logger.info("Connecting to Redis with URL...")
+        pool = aioredis.ConnectionPool.from_url(settings.REDIS_HOST, **pool_options)
+    # If individual Redis settings are provided, use those
+    elif settings.REDIS_HOST:
+        logger.info("Connecting to Redis with host/port settings...")
+        pool = aioredis.ConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT or 6379,
+            password=settings.REDIS_PASSWORD,
+            db=settings.REDIS_DB or 0,
+            **pool_options
+        )
+    # Otherwise, try to use REDIS_URL if available
+    elif settings.REDIS_URL:
+        logger.info("Connecting to Redis via REDIS_URL environment variable...")
+        pool = aioredis.ConnectionPool.from_url(settings.REDIS_URL, **pool_options)
+    else:
+        return None
+    
+    return aioredis.Redis(connection_pool=pool)
+
+
+async def _local_redis_port_open() -> bool:
+    """Cheap TCP probe so the local Redis client is only built when something is listening"""
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection("localhost", 6379),
+            timeout=REDIS_LOCAL_PROBE_TIMEOUT_SECONDS
+        )
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    await writer.wait_closed()
+    return True
+
+
+async def _connect_local_redis() -> Optional[aioredis.Redis]:
+    """Connect to a Redis on localhost, or return None if none is reachable"""
+    if not await _local_redis_port_open():
+        logger.info("No local Redis listening on localhost:6379, will try configured Redis")
+        return None
+    
+    logger.info("Attempting local Redis connection...")
+    local_client = aioredis.Redis(
+        host="localhost",
+        port=6379,
+        db=0,
+        socket_connect_timeout=REDIS_LOCAL_CONNECT_TIMEOUT_SECONDS,  # Short timeout for quick fail
+        decode_responses=False,
+        max_connections=REDIS_MAX_CONNECTIONS
+    )
+    try:
+        await asyncio.wait_for(local_client.ping(), timeout=REDIS_LOCAL_CONNECT_TIMEOUT_SECONDS)
+        logger.info("Connected to local Redis")
+        return local_client
+    except Exception as local_error:
+        logger.warning("Could not connect to local Redis: {}, will try configured Redis", local_error)
+        await local_client.aclose()
+        return None
+
+
+async def _prewarm_redis_pool(client: aioredis.Redis):
+    """Open a few pooled connections up front so early requests skip the connect cost"""
+    pool = client.connection_pool
+    connections = []
+    try:
+        for _ in range(REDIS_PREWARM_CONNECTIONS):
+            connections.append(await pool.get_connection("PING"))
+    except Exception as e:
+        logger.debug("Could not pre-warm Redis pool: {}", e)
+    finally:
+        for connection in connections:
+            await pool.release(connection)
+
+
+async def _connect_redis() -> Optional[aioredis.Redis]:
+    """Connect to Redis, returning None if it's unavailable or not configured"""
+    settings = get_settings()
     
-    _redis_connection_attempted = True
+    # For development or testing, use a local Redis if available
+    if settings.ENV in ("development", "testing"):
+        local_client = await _connect_local_redis()
+        if local_client is not None:
+            return local_client
     
-    # Maximum connection attempts
+    client = _create_redis_client(settings)
+    if client is None:
+        logger.warning("Redis configuration not found, caching will be disabled")
+        return None
+    
+    # Maximum connection attempts; only the ping is retried, the client and its pool are reused
     max_attempts = 3
     
     for attempt in range(1, max_attempts + 1):
         try:
-            # For development or testing, use a local Redis if available
-            if settings.ENV in ("development", "testing"):
-                try:
-                    logger.info(f"Attempting local Redis connection (attempt {attempt}/{max_attempts})...")
-                    # Try to connect to local Redis first
-                    test_client = redis.Redis(
-                        host="localhost",
-                        port=6379,
-                        db=0,
-                        socket_connect_timeout=2.0,  # Short timeout for quick fail
-                        decode_responses=False
-                    )
-                    test_client.ping()  # Test connection
-                    
-                    _redis_client = test_client
-                    logger.info("Connected to local Redis")
-                    return
-                except Exception as local_error:
-                    logger.warning(f"Could not connect to local Redis: {local_error}, will try configured Redis")
-            
-            # If REDIS_HOST starts with redis://, parse it as a URL
-            if settings.REDIS_HOST and settings.REDIS_HOST.startswith("redis://"):
-                try:
-                    logger.info(f"Connecting to Redis with URL (attempt {attempt}/{max_attempts})...")
-                    _redis_client = redis.from_url(
-                        settings.REDIS_HOST,
-                        decode_responses=False,
-                        socket_connect_timeout=5.0  # Timeout after 5 seconds
-                    )
-                    _redis_client.ping()  # Test connection
-                    logger.info("Connected to Redis via URL")
-                    return
-                except Exception as redis_url_error:
-                    logger.warning(f"Failed to connect to Redis with URL: {redis_url_error}")
-                    _redis_client = None
-            # If individual Redis settings are provided, use those
-            elif settings.REDIS_HOST:
-                try:
-                    logger.info(f"Connecting to Redis with host/port settings (attempt {attempt}/{max_attempts})...")
-                    _redis_client = redis.Redis(
-                        host=settings.REDIS_HOST,
-                        port=settings.REDIS_PORT or 6379,
-                        password=settings.REDIS_PASSWORD,
-                        db=settings.REDIS_DB or 0,
-                        decode_responses=False,
-                        socket_connect_timeout=5.0  # Timeout after 5 seconds
-                    )
-                    _redis_client.ping()  # Test connection
-                    logger.info("Connected to Redis via host/port settings")
-                    return
-                except Exception as redis_config_error:
-                    logger.warning(f"Failed to connect to Redis with configured settings: {redis_config_error}")
-                    _redis_client = None
-                    
-            # Otherwise, try to use REDIS_URL if available
-            elif os.getenv("REDIS_URL"):
-                try:
-                    logger.info(f"Connecting to Redis via REDIS_URL environment variable (attempt {attempt}/{max_attempts})...")
-                    _redis_client = redis.from_url(
-                        os.getenv("REDIS_URL"),
-                        decode_responses=False,
-                        socket_connect_timeout=5.0  # Timeout after 5 seconds
-                    )
-                    _redis_client.ping()  # Test connection
-                    logger.info("Connected to Redis via URL")
-                    return
-                except Exception as redis_url_error:
-                    logger.warning(f"Failed to connect to Redis with URL: {redis_url_error}")
-                    _redis_client = None
-            else:
-                logger.warning("Redis configuration not found, caching will be disabled")
-                _redis_client = None
-                return
-                
+            await asyncio.wait_for(client.ping(), timeout=REDIS_CONNECT_TIMEOUT_SECONDS)
+            _run_in_background(_prewarm_redis_pool(client))
+            logger.info("Connected to Redis")
+            return client
         except Exception as e:
-            logger.error(f"Failed to connect to Redis: {e}")
+            logger.warning("Failed to connect to Redis (attempt {}/{}): {}", attempt, max_attempts, e)
+            if attempt < max_attempts:
+                # Exponential backoff with jitter so transient failures get a chance to clear
+                await asyncio.sleep(REDIS_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1) + random.random() * 0.1)
             
     # If we get here, all attempts failed
     logger.warning("All Redis connection attempts failed, caching will be disabled")
+    await client.aclose()
+    return None
+
+
+async def init_redis():
+    """Initialize Redis connection."""
+    global _redis_client, _redis_connection_attempted
+    
+    # Don't attempt connection more than once
+    if _redis_connection_attempted:
+        return
+    
+    # Concurrent callers wait for the first connection attempt instead of starting their own
+    async with _redis_lock:
+        if _redis_connection_attempted:
+            return
+        _redis_client = await _connect_redis()
+        _redis_connection_attempted = True
+        if _redis_client is not None and not HIREDIS_AVAILABLE:
+            logger.warning("hiredis is not installed, Redis replies will use the pure-Python parser")
+
+
+async def close_redis_connection():
+    """Close Redis connection"""
+    global _redis_client, _redis_connection_attempted
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        logger.info("Redis connection closed")
     _redis_client = None
+    _redis_connection_attempted = False
 
 
 def get_redis():
@@ -150,12 +313,12 @@ def init_app(app):
     
     @app.on_event("startup")
     async def startup_db_client():
-        await connect_to_mongodb()
-        await init_redis()
+        await connect_to_datastores()
         
         # Debug log to see if CORS origins are being properly loaded
-        logger.debug(f"Configured CORS Origins: {settings.CORS_ORIGINS}")
+        logger.opt(lazy=True).debug("Configured CORS Origins: {}", lambda: get_settings().CORS_ORIGINS)
         
     @app.on_event("shutdown")
     async def shutdown_db_client():
-        await close_mongodb_connection() 
\ No newline at end of file
+        await close_mongodb_connection()
+        await close_redis_connection() 
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Shared HTTP client for outbound requests.
+
+A single httpx.AsyncClient is created at startup and reused so requests to
+external services share a connection pool instead of paying for a new
+TCP/TLS handshake on every call.
+"""
+import httpx
+from loguru import logger
+from typing import Optional
+
+# Default timeout (seconds) for outbound requests
+HTTP_CLIENT_TIMEOUT = 10.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(timeout=HTTP_CLIENT_TIMEOUT)
+
+
+async def init_http_client():
+    """Create the shared HTTP client"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+        logger.info("Shared HTTP client initialized")
+
+
+async def close_http_client():
+    """Close the shared HTTP client"""
+    global _http_client
+    if _http_client is not None and not _http_client.is_closed:
+        await _http_client.aclose()
+        logger.info("Shared HTTP client closed")
+    _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use outside the app lifespan"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _create_http_client()
+    return _http_client
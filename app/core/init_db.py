@@ -1,27 +1,63 @@
 """
 Database initialization module for ensuring data exists.
+
+Run once per deployment, before the API server forks its workers:
+
+    python -m app.core.init_db
 """
 import asyncio
 import os
+import sys
 from loguru import logger
-from ..data_pipeline.check_db import check_movies_exist
+from .database import get_database, connect_to_mongodb, close_mongodb_connection
 from ..data_pipeline.quick_load import load_sample_data
 
 # Constants for configuration
 MIN_MOVIES_REQUIRED = 1000  # Require at least 1000 movies
 USE_FULL_DATASET = os.getenv("USE_FULL_DATASET", "true").lower() == "true"
 
+async def _movies_exist(min_count: int) -> bool:
+    """Check the movie count through the shared async client"""
+    try:
+        # Collection metadata count; avoids scanning the collection
+        movie_count = await get_database().movies.estimated_document_count()
+        return movie_count >= min_count
+    except Exception as e:
+        logger.error(f"Error checking movies in database: {e}")
+        return False
+
+
+# Set once the movie check (and any load) has run in this process
+_movies_checked = False
+_movies_lock = asyncio.Lock()
+
+
 async def ensure_movies_exist():
     """
     Check if movies exist in the database, if not load data.
+    Runs at most once per process; concurrent callers wait for the first run.
     
     Returns:
         bool: True if data was loaded, False if data already existed
     """
+    global _movies_checked
+    if _movies_checked:
+        return False
+    
+    async with _movies_lock:
+        if _movies_checked:
+            return False
+        data_loaded = await _load_movies_if_missing()
+        _movies_checked = True
+        return data_loaded
+
+
+async def _load_movies_if_missing():
+    """Load the full dataset or sample data when too few movies exist"""
     # Require more movies when using full dataset
     min_count = MIN_MOVIES_REQUIRED if USE_FULL_DATASET else 10
     
-    if not check_movies_exist(min_count=min_count):
+    if not await _movies_exist(min_count):
         # Run data loading in a thread to avoid blocking the event loop
         loop = asyncio.get_event_loop()
         
@@ -55,4 +91,23 @@ async def ensure_movies_exist():
             return False
     
     logger.info(f"At least {min_count} movies already exist in database")
-    return False 
\ No newline at end of file
+    return False
+
+
+async def _main() -> int:
+    """Connect, load movies if the database is missing them, and disconnect"""
+    try:
+        await connect_to_mongodb()
+        logger.info("Checking if movie data exists in database")
+        data_loaded = await ensure_movies_exist()
+        logger.info("Movie data has been loaded" if data_loaded else "No movie data was loaded")
+        return 0
+    except Exception as e:
+        logger.error(f"Database initialization failed: {e}")
+        return 1
+    finally:
+        await close_mongodb_connection()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(_main()))
@@ -0,0 +1,41 @@
+"""
+Startup warm-up for request models and the OpenAPI schema.
+
+Run from the FastAPI lifespan so one-off first-use costs are paid before the
+instance takes traffic rather than by the first user request.
+"""
+from fastapi import FastAPI
+from loguru import logger
+import orjson
+
+from ..models.movie import MovieResponse, PaginatedMovieResponse
+from ..models.interaction import InteractionResponse
+from ..models.recommendation import RecommendationResponse, UserRecommendationResponse
+
+# Smallest valid payload for each response model
+_MOVIE_FIXTURE = {"id": "000000000000000000000000", "title": "", "genres": []}
+_MODEL_FIXTURES = (
+    (MovieResponse, _MOVIE_FIXTURE),
+    (PaginatedMovieResponse, {"items": [_MOVIE_FIXTURE], "total": 1, "page": 1, "size": 1, "pages": 1}),
+    (InteractionResponse, {"_id": "000000000000000000000000", "movieId": "", "timestamp": 0}),
+    (RecommendationResponse, {"movie": _MOVIE_FIXTURE, "score": 0.0}),
+    (UserRecommendationResponse, {"userId": "", "recommendations": [{"movie": _MOVIE_FIXTURE, "score": 0.0}]}),
+)
+
+
+def warm_up_models() -> None:
+    """Round-trip a minimal fixture through each response model's validator and serializer"""
+    for model, fixture in _MODEL_FIXTURES:
+        model.model_rebuild()
+        model.model_validate(fixture).model_dump(mode="json")
+
+
+def warm_up(app: FastAPI) -> None:
+    """Warm the response models and build and encode the OpenAPI schema so /docs doesn't pay for it"""
+    try:
+        warm_up_models()
+        app.state.openapi_bytes = orjson.dumps(app.openapi())
+        logger.info("Response models and OpenAPI schema warmed up")
+    except Exception as e:
+        # Warm-up is an optimization only; never block startup on it
+        logger.warning(f"Startup warm-up failed: {e}")
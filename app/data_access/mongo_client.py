@@ -1,9 +1,27 @@
 from motor.motor_asyncio import AsyncIOMotorDatabase, AsyncIOMotorCollection
 from bson import ObjectId
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from ..core.database import get_database
+from ..core.database import get_collection
 from loguru import logger
 from ..core.exceptions import MovieNotFoundError
+from ..utils.helpers import EMBEDDING_FIELDS, decode_embedding
+
+# Documents fetched per round trip when streaming a user's interaction history
+USER_MOVIE_IDS_BATCH_SIZE = 1000
+
+# Invariant projections and sorts, built once instead of per query
+_MOVIES_LIST_PROJECTION = {field: 0 for field in EMBEDDING_FIELDS}
+_SEARCH_PROJECTION = {"score": {"$meta": "textScore"}, **_MOVIES_LIST_PROJECTION}
+_SEARCH_SORT = [("score", {"$meta": "textScore"})]
+_EMBEDDING_PROJECTION = {field: 1 for field in EMBEDDING_FIELDS}
+_USER_MOVIE_IDS_PROJECTION = {"movie_id": 1, "_id": 0}
+
+
+@lru_cache(maxsize=8192)
+def _to_object_id(value: str) -> Optional[ObjectId]:
+    """Parse a hex string into an ObjectId, or None if it isn't valid; repeated ids skip the parse"""
+    return ObjectId(value) if ObjectId.is_valid(value) else None
 
 class BaseRepository:
     """Base repository class for MongoDB collections"""
@@ -11,10 +29,9 @@ class BaseRepository:
     def __init__(self, collection_name: str):
         self.collection_name = collection_name
     
-    async def get_collection(self) -> AsyncIOMotorCollection:
+    def get_collection(self) -> AsyncIOMotorCollection:
         """Get the MongoDB collection"""
-        db = get_database()
-        return db[self.collection_name]
+        return get_collection(self.collection_name)
 
 
 class MovieRepository(BaseRepository):
@@ -39,11 +56,12 @@ class MovieRepository(BaseRepository):
         """
         try:
             # Validate movie_id format before query
-            if not ObjectId.is_valid(movie_id):
+            object_id = _to_object_id(movie_id)
+            if object_id is None:
                 raise ValueError(f"Invalid ObjectId format: {movie_id}")
                 
-            collection = await self.get_collection()
-            movie = await collection.find_one({"_id": ObjectId(movie_id)})
+            collection = self.get_collection()
+            movie = await collection.find_one({"_id": object_id})
             
             if not movie:
                 raise MovieNotFoundError(f"Movie with ID {movie_id} not found")
@@ -57,40 +75,50 @@ class MovieRepository(BaseRepository):
             logger.error(f"Error in MovieRepository.get_by_id: {e}")
             raise
     
+    async def get_by_ids(self, movie_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get several movies in a single $in query
+        
+        Args:
+            movie_ids: MongoDB ObjectIds as strings; invalid ids are skipped
+            
+        Returns:
+            Movie documents that were found, in no particular order
+        """
+        try:
+            object_ids = [object_id for object_id in map(_to_object_id, movie_ids) if object_id is not None]
+            if not object_ids:
+                return []
+            
+            collection = self.get_collection()
+            cursor = collection.find({"_id": {"$in": object_ids}}, _MOVIES_LIST_PROJECTION).batch_size(len(object_ids))
+            return await cursor.to_list(length=len(object_ids))
+        except Exception as e:
+            logger.error(f"Error in MovieRepository.get_by_ids: {e}")
+            return []
+    
     async def get_movies(self, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
         """Get a paginated list of movies"""
         try:
-            print(f"MovieRepository.get_movies called with skip={skip}, limit={limit}")
-            collection = await self.get_collection()
-            print("Got collection, executing find query...")
+            collection = self.get_collection()
             # Exclude embedding field as it's large and not needed for listing
-            cursor = collection.find({}, {"embedding": 0}).skip(skip).limit(limit)
-            
-            print("Converting cursor to list...")
+            cursor = collection.find({}, _MOVIES_LIST_PROJECTION).skip(skip).limit(limit)
             result = await cursor.to_list(length=limit)
-            print(f"Found {len(result)} movies")
-            
-            if len(result) > 0:
-                print(f"First movie (sample): {result[0]['title']}")
-                print(f"First movie fields: {list(result[0].keys())}")
-            
+            logger.debug("get_movies skip={} limit={} -> {} docs", skip, limit, len(result))
             return result
         except Exception as e:
             logger.error(f"Error in MovieRepository.get_movies: {e}")
-            print(f"Error in MovieRepository.get_movies: {e}")
             return []
     
     async def search_movies(self, query: str, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
         """Search for movies by title"""
         try:
-            collection = await self.get_collection()
-            # Create a text index on title if it doesn't exist
-            await collection.create_index([("title", "text")])
-            
+            collection = self.get_collection()
+            # The title text index is created at startup by ensure_indexes()
             cursor = collection.find(
                 {"$text": {"$search": query}},
-                {"score": {"$meta": "textScore"}, "embedding": 0}
-            ).sort([("score", {"$meta": "textScore"})]).skip(skip).limit(limit)
+                _SEARCH_PROJECTION
+            ).sort(_SEARCH_SORT).skip(skip).limit(limit)
             
             return await cursor.to_list(length=limit)
         except Exception as e:
@@ -100,15 +128,18 @@ class MovieRepository(BaseRepository):
     async def get_embedding(self, movie_id: str) -> Optional[List[float]]:
         """Get the embedding vector for a movie"""
         try:
-            collection = await self.get_collection()
+            object_id = _to_object_id(movie_id)
+            if object_id is None:
+                logger.error(f"Error in MovieRepository.get_embedding: invalid ObjectId {movie_id}")
+                return None
+            
+            collection = self.get_collection()
             result = await collection.find_one(
-                {"_id": ObjectId(movie_id)},
-                {"embedding": 1}
+                {"_id": object_id},
+                _EMBEDDING_PROJECTION
             )
             
-            if result and "embedding" in result:
-                return result["embedding"]
-            return None
+            return decode_embedding(result)
         except Exception as e:
             logger.error(f"Error in MovieRepository.get_embedding: {e}")
             return None
@@ -123,7 +154,7 @@ class InteractionRepository(BaseRepository):
     async def create_interaction(self, interaction_data: Dict[str, Any]) -> Optional[str]:
         """Create a new interaction"""
         try:
-            collection = await self.get_collection()
+            collection = self.get_collection()
             result = await collection.insert_one(interaction_data)
             return str(result.inserted_id)
         except Exception as e:
@@ -133,7 +164,7 @@ class InteractionRepository(BaseRepository):
     async def get_user_interactions(self, user_id: str, skip: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
         """Get a user's interactions"""
         try:
-            collection = await self.get_collection()
+            collection = self.get_collection()
             cursor = collection.find({"user_id": user_id}).sort("timestamp", -1).skip(skip).limit(limit)
             return await cursor.to_list(length=limit)
         except Exception as e:
@@ -143,15 +174,16 @@ class InteractionRepository(BaseRepository):
     async def get_user_movie_ids(self, user_id: str, interaction_type: Optional[str] = None) -> List[str]:
         """Get movie IDs that a user has interacted with"""
         try:
-            collection = await self.get_collection()
+            collection = self.get_collection()
             query = {"user_id": user_id}
             if interaction_type:
                 query["type"] = interaction_type
                 
-            cursor = collection.find(query, {"movie_id": 1})
+            # Project out _id so the user_type_movie_cov index covers the query
+            cursor = collection.find(query, _USER_MOVIE_IDS_PROJECTION).batch_size(USER_MOVIE_IDS_BATCH_SIZE)
             
-            results = await cursor.to_list(length=None)
-            return [doc["movie_id"] for doc in results if "movie_id" in doc]
+            # Stream the batches instead of materializing every interaction document first
+            return [doc["movie_id"] async for doc in cursor if "movie_id" in doc]
         except Exception as e:
             logger.error(f"Error in InteractionRepository.get_user_movie_ids: {e}")
             return [] 
\ No newline at end of file
@@ -1,97 +1,146 @@
 import redis
-import json
+import redis.asyncio as aioredis
+import orjson
 from typing import Any, Optional, Dict, List, Union
 from ..core.database import get_redis
 from loguru import logger
 
+# Keys requested per SCAN round trip and deleted per DEL call in delete_pattern
+SCAN_BATCH_SIZE = 500
+
 class CacheRepository:
     """Repository for Redis cache operations"""
     
     def __init__(self):
         pass
     
-    def get_redis(self) -> Optional[redis.Redis]:
+    def get_redis(self) -> Optional[aioredis.Redis]:
         """Get Redis client"""
         return get_redis()
     
-    def get(self, key: str) -> Optional[str]:
+    async def get(self, key: str) -> Optional[str]:
         """Get a value from the cache"""
         try:
             redis_client = self.get_redis()
             if not redis_client:
                 return None
             
-            value = redis_client.get(key)
+            value = await redis_client.get(key)
             return value.decode('utf-8') if value else None
         except Exception as e:
             logger.error(f"Error in CacheRepository.get: {e}")
             return None
     
-    def get_json(self, key: str) -> Optional[Union[Dict, List]]:
+    async def get_json(self, key: str) -> Optional[Union[Dict, List]]:
         """Get a JSON value from the cache and parse it"""
         try:
-            value = self.get(key)
+            redis_client = self.get_redis()
+            if not redis_client:
+                return None
+            
+            # orjson parses the raw reply bytes directly, no intermediate decode
+            value = await redis_client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
             logger.error(f"Error in CacheRepository.get_json: {e}")
             return None
     
-    def set(self, key: str, value: str, ttl: int = 3600) -> bool:
+    async def set(self, key: str, value: Union[str, bytes], ttl: int = 3600) -> bool:
         """Set a value in the cache with TTL in seconds"""
         try:
             redis_client = self.get_redis()
             if not redis_client:
                 return False
             
-            result = redis_client.setex(key, ttl, value)
+            result = await redis_client.setex(key, ttl, value)
             return bool(result)
         except Exception as e:
             logger.error(f"Error in CacheRepository.set: {e}")
             return False
     
-    def set_json(self, key: str, value: Union[Dict, List], ttl: int = 3600) -> bool:
+    async def set_json(self, key: str, value: Union[Dict, List], ttl: int = 3600) -> bool:
         """Set a JSON value in the cache"""
         try:
-            json_str = json.dumps(value)
-            return self.set(key, json_str, ttl)
+            json_bytes = orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+            return await self.set(key, json_bytes, ttl)
         except Exception as e:
             logger.error(f"Error in CacheRepository.set_json: {e}")
             return False
     
-    def delete(self, key: str) -> bool:
+    async def mget_json(self, keys: List[str]) -> List[Optional[Union[Dict, List]]]:
+        """Get several JSON values in one round trip; missing or unreadable entries are None"""
+        if not keys:
+            return []
+        try:
+            redis_client = self.get_redis()
+            if not redis_client:
+                return [None] * len(keys)
+            
+            values = await redis_client.mget(keys)
+            results = []
+            for value in values:
+                try:
+                    results.append(orjson.loads(value) if value else None)
+                except orjson.JSONDecodeError:
+                    results.append(None)
+            return results
+        except Exception as e:
+            logger.error(f"Error in CacheRepository.mget_json: {e}")
+            return [None] * len(keys)
+    
+    async def mset_json(self, items: Dict[str, Union[Dict, List]], ttl: int = 3600) -> bool:
+        """Set several JSON values with the same TTL in one pipelined round trip"""
+        if not items:
+            return True
+        try:
+            redis_client = self.get_redis()
+            if not redis_client:
+                return False
+            
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY))
+                results = await pipe.execute()
+            return all(results)
+        except Exception as e:
+            logger.error(f"Error in CacheRepository.mset_json: {e}")
+            return False
+    
+    async def delete(self, key: str) -> bool:
         """Delete a value from the cache"""
         try:
             redis_client = self.get_redis()
             if not redis_client:
                 return False
             
-            result = redis_client.delete(key)
+            result = await redis_client.delete(key)
             return bool(result)
         except Exception as e:
             logger.error(f"Error in CacheRepository.delete: {e}")
             return False
     
-    def delete_pattern(self, pattern: str) -> int:
+    async def delete_pattern(self, pattern: str) -> int:
         """Delete all keys matching a pattern"""
         try:
             redis_client = self.get_redis()
             if not redis_client:
-                logger.debug(f"Redis not available, skipping delete_pattern for: {pattern}")
+                logger.debug("Redis not available, skipping delete_pattern for: {}", pattern)
                 return 0
             
-            # Check if keys method is available (some Redis clients might not support it)
-            if not hasattr(redis_client, 'keys'):
-                logger.warning("Redis client does not support 'keys' method")
-                return 0
-                
+            # Walk the keyspace incrementally with SCAN instead of a blocking KEYS call
             try:
-                keys = redis_client.keys(pattern)
-                if not keys:
-                    return 0
-                    
-                return redis_client.delete(*keys)
+                deleted = 0
+                batch = []
+                async for key in redis_client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+                    batch.append(key)
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        deleted += await redis_client.delete(*batch)
+                        batch = []
+                if batch:
+                    deleted += await redis_client.delete(*batch)
+                return deleted
             except redis.exceptions.ResponseError as e:
                 logger.warning(f"Redis pattern matching error: {e}")
                 return 0
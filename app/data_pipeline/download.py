@@ -9,7 +9,6 @@ import os
 import sys
 import requests
 import zipfile
-import io
 import tempfile
 import logging
 import argparse
@@ -17,6 +16,8 @@ from pathlib import Path
 import shutil
 from loguru import logger
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Load environment variables
 load_dotenv()
@@ -27,6 +28,24 @@ GCS_BUCKET_NAME = os.getenv("GCS_BUCKET_NAME")
 DATASET_PATH = "datasets/movielens"
 USE_LOCAL_STORAGE = os.getenv("USE_LOCAL_STORAGE", "false").lower() == "true"
 LOCAL_DATA_DIR = os.getenv("LOCAL_DATA_DIR", "./data")
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # Stream downloads to disk 1 MB at a time
+GCS_UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # Must be a multiple of 256 KB
+
+
+def _create_session():
+    """Pooled session so retries and repeat downloads reuse the TLS connection"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_session = _create_session()
 
 
 def setup_logging():
@@ -38,20 +57,25 @@ def setup_logging():
     logger.add(sys.stderr, format="{time} {level} {message}", level="INFO")
 
 
-def download_movielens(url=MOVIELENS_URL):
+def download_movielens(dest_path, url=MOVIELENS_URL):
     """
     Download the MovieLens dataset from the specified URL
-    Returns the content as bytes
+    Streams the zip straight to dest_path and returns that path
     """
     logger.info(f"Downloading MovieLens dataset from {url}")
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.content
+    with _session.get(url, stream=True) as response:
+        response.raise_for_status()
+        # Undo any transfer encoding so the file on disk is the raw zip
+        response.raw.decode_content = True
+        with open(dest_path, "wb") as f:
+            shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+    return dest_path
 
 
-def save_to_gcs(content, bucket_name, destination_blob_name):
+def save_to_gcs(file_path, bucket_name, destination_blob_name, force=False):
     """
-    Save content to Google Cloud Storage
+    Save a local file to Google Cloud Storage
+    Unless force is set, the upload only succeeds if the blob doesn't exist yet
     """
     logger.info(f"Saving dataset to GCS bucket: {bucket_name}/{destination_blob_name}")
     
@@ -63,8 +87,10 @@ def save_to_gcs(content, bucket_name, destination_blob_name):
         bucket = storage_client.bucket(bucket_name)
         blob = bucket.blob(destination_blob_name)
         
-        # Upload content
-        blob.upload_from_string(content)
+        # Resumable upload in 8 MB chunks so large files don't go up in one request
+        blob.chunk_size = GCS_UPLOAD_CHUNK_SIZE
+        with open(file_path, "rb") as f:
+            blob.upload_from_file(f, rewind=True, if_generation_match=None if force else 0)
         
         logger.info(f"Dataset saved to {destination_blob_name}")
         return True
@@ -73,24 +99,15 @@ def save_to_gcs(content, bucket_name, destination_blob_name):
         return False
 
 
-def save_to_local(content, destination_path):
+def save_to_local(destination_path):
     """
-    Save content to local filesystem
+    Extract a downloaded dataset zip next to it on the local filesystem
     """
     try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(destination_path), exist_ok=True)
-        
-        logger.info(f"Saving dataset to local path: {destination_path}")
-        
-        # Write the content to the file
-        with open(destination_path, "wb") as f:
-            f.write(content)
-            
         logger.info(f"Dataset saved to {destination_path}")
         
         # Extract the zip file
-        with zipfile.ZipFile(io.BytesIO(content)) as zip_ref:
+        with zipfile.ZipFile(destination_path) as zip_ref:
             extract_path = os.path.join(os.path.dirname(destination_path), "ml-latest-small")
             logger.info(f"Extracting dataset to {extract_path}")
             zip_ref.extractall(extract_path)
@@ -144,11 +161,14 @@ def download_dataset(force=False, use_local_storage=USE_LOCAL_STORAGE):
             return True
         
         try:
-            # Download the dataset
-            content = download_movielens()
+            # Create directory if it doesn't exist
+            os.makedirs(os.path.dirname(destination_path), exist_ok=True)
             
-            # Save locally
-            success = save_to_local(content, destination_path)
+            # Download the dataset straight to its destination
+            download_movielens(destination_path)
+            
+            # Extract it locally
+            success = save_to_local(destination_path)
             
             if success:
                 logger.info("MovieLens dataset successfully downloaded and saved locally")
@@ -174,11 +194,10 @@ def download_dataset(force=False, use_local_storage=USE_LOCAL_STORAGE):
             return True
         
         try:
-            # Download the dataset
-            content = download_movielens()
-            
-            # Save to GCS
-            success = save_to_gcs(content, GCS_BUCKET_NAME, destination_blob)
+            # Download the dataset to a temporary file and upload it from disk
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                zip_path = download_movielens(os.path.join(tmp_dir, "ml-latest-small.zip"))
+                success = save_to_gcs(zip_path, GCS_BUCKET_NAME, destination_blob, force=force)
             
             if success:
                 logger.info("MovieLens dataset successfully downloaded and saved to GCS")
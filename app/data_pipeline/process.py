@@ -8,7 +8,6 @@ import os
 import sys
 import zipfile
 import io
-import tempfile
 import pandas as pd
 import numpy as np
 import json
@@ -18,8 +17,9 @@ from pathlib import Path
 from dotenv import load_dotenv
 from loguru import logger
 from sentence_transformers import SentenceTransformer
-from pymongo import MongoClient, UpdateOne
-from tqdm import tqdm
+import torch
+from pymongo import MongoClient, UpdateOne, IndexModel, ASCENDING, TEXT
+from bson import Binary
 import re
 import httpx
 import asyncio
@@ -36,9 +36,49 @@ GCS_BUCKET_NAME = os.getenv("GCS_BUCKET_NAME")
 DATASET_PATH = "datasets/movielens"
 MONGODB_URI = os.getenv("MONGODB_URI")
 HF_MODEL_NAME = os.getenv("HF_MODEL_NAME", "sentence-transformers/all-MiniLM-L6-v2")
+HF_CACHE_DIR = os.getenv("HF_HOME", "./.hf_cache")
 USE_LOCAL_STORAGE = os.getenv("USE_LOCAL_STORAGE", "false").lower() == "true"
 LOCAL_DATA_DIR = os.getenv("LOCAL_DATA_DIR", "./data")
 
+# Use the multithreaded pyarrow CSV parser when it's installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# TMDB client settings for poster lookups
+TMDB_API_BASE_URL = "https://api.themoviedb.org/3"
+TMDB_MAX_CONNECTIONS = 20
+TMDB_MAX_CONCURRENCY = 10
+TMDB_TIMEOUT = 10.0
+TMDB_RATE_LIMIT = 40  # requests allowed per TMDB_RATE_PERIOD
+TMDB_RATE_PERIOD = 10.0
+TMDB_PROGRESS_INTERVAL = 500  # log progress every N lookups
+
+# Compact column types for the MovieLens CSVs (pandas would default to int64/float64)
+MOVIES_CSV_DTYPES = {"movieId": "int32", "title": "string", "genres": "string"}
+RATINGS_CSV_DTYPES = {"userId": "int32", "movieId": "int32", "rating": "float32", "timestamp": "int64"}
+
+# Columns prepare_movies_with_posters adds to the movies frame
+POSTER_COLUMNS = ("poster_path", "backdrop_path", "tmdb_id", "year")
+
+# Indexes the loaded collections need; (userId, movieId) also serves userId-only lookups
+MOVIE_INDEXES = [
+    IndexModel([("movieId_ml", ASCENDING)], unique=True),
+    IndexModel([("title", TEXT)]),
+]
+INTERACTION_INDEXES = [
+    IndexModel([("userId", ASCENDING), ("movieId", ASCENDING)]),
+    IndexModel([("movieId", ASCENDING)]),
+]
+
+# Index options that must match for an existing index to be kept as is
+INDEX_OPTIONS_COMPARED = ("unique", "sparse")
+
+# Trailing release year in MovieLens titles, e.g. "Toy Story (1995)"
+_YEAR_RE = re.compile(r"\s*\((\d{4})\)$")
+
 
 def setup_logging():
     """Configure logging"""
@@ -122,6 +162,15 @@ def read_from_local(file_path):
         return None
 
 
+def read_movielens_csvs(movies_source, ratings_source):
+    """
+    Read movies.csv and ratings.csv (paths or open files) with explicit compact dtypes
+    """
+    movies_df = pd.read_csv(movies_source, engine=CSV_ENGINE, dtype=MOVIES_CSV_DTYPES)
+    ratings_df = pd.read_csv(ratings_source, engine=CSV_ENGINE, dtype=RATINGS_CSV_DTYPES)
+    return movies_df, ratings_df
+
+
 def extract_movielens_data(content):
     """
     Extract MovieLens zip file and return DataFrames
@@ -130,15 +179,19 @@ def extract_movielens_data(content):
     
     try:
         with zipfile.ZipFile(io.BytesIO(content)) as zip_ref:
-            with tempfile.TemporaryDirectory() as tmp_dir:
-                zip_ref.extractall(tmp_dir)
-                
-                # Read the CSV files
-                movies_df = pd.read_csv(f"{tmp_dir}/ml-latest-small/movies.csv")
-                ratings_df = pd.read_csv(f"{tmp_dir}/ml-latest-small/ratings.csv")
-                
-                logger.info(f"Extracted {len(movies_df)} movies and {len(ratings_df)} ratings")
-                return movies_df, ratings_df
+            # Locate the CSVs whatever the dataset's top-level folder is called
+            members = {Path(name).name: name for name in zip_ref.namelist()}
+            missing = [name for name in ("movies.csv", "ratings.csv") if name not in members]
+            if missing:
+                raise ValueError(f"{', '.join(missing)} not found in archive")
+            
+            # Read the CSV files straight out of the archive
+            with zip_ref.open(members["movies.csv"]) as movies_file, \
+                    zip_ref.open(members["ratings.csv"]) as ratings_file:
+                movies_df, ratings_df = read_movielens_csvs(movies_file, ratings_file)
+            
+            logger.info(f"Extracted {len(movies_df)} movies and {len(ratings_df)} ratings")
+            return movies_df, ratings_df
     except Exception as e:
         logger.error(f"Error extracting dataset: {e}")
         return None, None
@@ -152,8 +205,9 @@ def extract_from_directory(directory_path):
     
     try:
         # Read the CSV files
-        movies_df = pd.read_csv(f"{directory_path}/movies.csv")
-        ratings_df = pd.read_csv(f"{directory_path}/ratings.csv")
+        movies_df, ratings_df = read_movielens_csvs(
+            f"{directory_path}/movies.csv", f"{directory_path}/ratings.csv"
+        )
         
         logger.info(f"Read {len(movies_df)} movies and {len(ratings_df)} ratings")
         return movies_df, ratings_df
@@ -168,50 +222,113 @@ def preprocess_movies(movies_df):
     """
     logger.info("Preprocessing movies data")
     
-    # Convert 'genres' from string to list
-    movies_df['genres'] = movies_df['genres'].apply(lambda x: x.split('|') if x != '(no genres listed)' else [])
+    # Work on the raw '|'-separated genres with vectorized string ops
+    genres = movies_df['genres'].replace('(no genres listed)', '')
+    has_genres = genres != ''
     
     # Create text representation for embedding generation
-    movies_df['text_for_embedding'] = movies_df.apply(
-        lambda row: f"{row['title']} {' '.join(row['genres'])}", 
-        axis=1
+    movies_df['text_for_embedding'] = movies_df['title'] + ' ' + genres.str.replace('|', ' ', regex=False)
+    
+    # Convert 'genres' from string to list
+    movies_df['genres'] = genres.str.split('|').where(
+        has_genres, pd.Series([[] for _ in range(len(genres))], index=genres.index)
     )
     
     return movies_df
 
 
-def generate_embeddings(movies_df, model_name=HF_MODEL_NAME, batch_size=32):
+def _select_device():
+    """Pick the device to run the embedding model on"""
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def _is_oom_error(error):
+    """Check whether an exception is a CUDA out-of-memory error"""
+    oom_error = getattr(torch.cuda, "OutOfMemoryError", None)
+    if oom_error is not None and isinstance(error, oom_error):
+        return True
+    return isinstance(error, RuntimeError) and "out of memory" in str(error)
+
+
+def _load_embedding_model(model_name, device):
+    """Load the model from the local cache, only going to the Hugging Face hub if it isn't cached yet"""
+    try:
+        return SentenceTransformer(model_name, device=device, cache_folder=HF_CACHE_DIR, local_files_only=True)
+    except Exception:
+        logger.info(f"Model {model_name} not found in {HF_CACHE_DIR}, downloading")
+        return SentenceTransformer(model_name, device=device, cache_folder=HF_CACHE_DIR)
+
+
+def generate_embeddings(movies_df, model_name=HF_MODEL_NAME, batch_size=64):
     """
     Generate embeddings for movies using Hugging Face model
     """
-    logger.info(f"Loading model: {model_name}")
-    model = SentenceTransformer(model_name)
+    device = _select_device()
+    logger.info(f"Loading model: {model_name} on {device}")
+    model = _load_embedding_model(model_name, device)
+    
+    # FP16 halves memory traffic and uses tensor cores on GPU; CPUs stay on FP32
+    if device == "cuda":
+        model.half()
     
     # Get text representations
     texts = movies_df['text_for_embedding'].tolist()
     
     logger.info(f"Generating embeddings for {len(texts)} movies")
     
-    # Process in batches to manage memory
-    embeddings = []
-    for i in tqdm(range(0, len(texts), batch_size)):
-        batch_texts = texts[i:i+batch_size]
-        batch_embeddings = model.encode(batch_texts, show_progress_bar=False)
-        embeddings.extend(batch_embeddings.tolist())
-    
-    # Add embeddings to DataFrame
-    movies_df['embedding'] = embeddings
+    # One encode call lets sentence-transformers sort by length and batch internally,
+    # so each minibatch is only padded to its own longest text.
+    # On GPU OOM, retry with half the batch size.
+    while True:
+        try:
+            embeddings = model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=True,
+                convert_to_numpy=True
+            )
+            break
+        except Exception as e:
+            if device != "cuda" or batch_size <= 1 or not _is_oom_error(e):
+                raise
+            torch.cuda.empty_cache()
+            batch_size //= 2
+            logger.warning(f"CUDA out of memory, retrying with batch_size={batch_size}")
+    
+    # Add embeddings to DataFrame as float32 row arrays (FP16 output is upcast); they stay
+    # arrays until prepare_movies_for_mongodb quantizes them, never lists of Python floats
+    movies_df['embedding'] = list(embeddings.astype(np.float32, copy=False))
     
     logger.info(f"Generated {len(embeddings)} embeddings")
     return movies_df
 
 
-async def fetch_movie_poster(movie_title, movie_year=None, api_key=None):
+class RateLimiter:
+    """Spaces out acquisitions so at most max_rate happen per period seconds"""
+    
+    def __init__(self, max_rate, period):
+        self._interval = period / max_rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def fetch_movie_poster(client, semaphore, rate_limiter, movie_title, movie_year=None, api_key=None):
     """
     Fetch movie poster from TMDB API
     
     Args:
-        movie_title: Title of the movie
+        client: Shared httpx.AsyncClient with the TMDB base URL
+        semaphore: Semaphore bounding in-flight TMDB requests
+        rate_limiter: RateLimiter keeping under TMDB's request rate
+        movie_title: Title of the movie, without the trailing "(year)"
         movie_year: Optional release year
         api_key: TMDB API key
         
@@ -220,21 +337,11 @@ async def fetch_movie_poster(movie_title, movie_year=None, api_key=None):
     """
     if not api_key:
         return None, None, None
-        
-    # Extract year from title if not provided
-    if movie_year is None and re.search(r"\((\d{4})\)$", movie_title):
-        year_match = re.search(r"\((\d{4})\)$", movie_title)
-        movie_year = int(year_match.group(1))
-        # Clean title
-        clean_title = re.sub(r"\s*\(\d{4}\)$", "", movie_title)
-    else:
-        clean_title = movie_title
     
     # Prepare API request
-    base_url = "https://api.themoviedb.org/3"
     params = {
         "api_key": api_key,
-        "query": clean_title,
+        "query": movie_title,
         "language": "en-US",
         "include_adult": "false",
         "page": "1"
@@ -245,28 +352,25 @@ async def fetch_movie_poster(movie_title, movie_year=None, api_key=None):
     
     try:
         # Make request
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{base_url}/search/movie",
-                params=params,
-                timeout=10.0
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"TMDB API error: {response.status_code}")
-                return None, None, None
-                
-            data = response.json()
-            
-            # Check if we have results
-            if not data.get("results") or len(data["results"]) == 0:
-                return None, None, None
-                
-            # Get first result
-            movie = data["results"][0]
+        async with semaphore:
+            await rate_limiter.acquire()
+            response = await client.get("/search/movie", params=params)
+        
+        if response.status_code != 200:
+            logger.error(f"TMDB API error: {response.status_code}")
+            return None, None, None
             
-            return movie.get("poster_path"), movie.get("backdrop_path"), movie.get("id")
+        data = response.json()
+        
+        # Check if we have results
+        if not data.get("results") or len(data["results"]) == 0:
+            return None, None, None
             
+        # Get first result
+        movie = data["results"][0]
+        
+        return movie.get("poster_path"), movie.get("backdrop_path"), movie.get("id")
+        
     except Exception as e:
         logger.error(f"Error fetching poster for {movie_title}: {e}")
         return None, None, None
@@ -285,42 +389,45 @@ async def prepare_movies_with_posters(movies_df, tmdb_api_key=None):
         movies_df['tmdb_id'] = None
         return movies_df
     
-    # Create columns for poster data
-    movies_df['poster_path'] = None
-    movies_df['backdrop_path'] = None  
-    movies_df['tmdb_id'] = None
-    
-    # Extract year from title if available
-    movies_df['year'] = movies_df['title'].str.extract(r'\((\d{4})\)$').astype('float').astype('Int64')
-    
-    # Process in batches with rate limiting
-    batch_size = 5  # Process 5 movies at a time
-    rate_limit = 0.5  # Wait 0.5 seconds between batches
-    movies_processed = 0
+    # Split the year off the titles once for the whole frame
+    movies_df['year'] = movies_df['title'].str.extract(_YEAR_RE)[0].astype('float').astype('Int64')
+    clean_titles = movies_df['title'].str.replace(_YEAR_RE, '', regex=True)
+    
+    # One keep-alive client for every lookup; the semaphore bounds requests in flight
+    # and the rate limiter keeps under TMDB's request quota
+    limits = httpx.Limits(max_keepalive_connections=TMDB_MAX_CONNECTIONS, max_connections=TMDB_MAX_CONNECTIONS)
+    semaphore = asyncio.Semaphore(TMDB_MAX_CONCURRENCY)
+    rate_limiter = RateLimiter(TMDB_RATE_LIMIT, TMDB_RATE_PERIOD)
+    
+    # Collect results in plain lists and assign whole columns at the end
+    posters = [None] * len(movies_df)
+    backdrops = [None] * len(movies_df)
+    tmdb_ids = [None] * len(movies_df)
+    
+    async def fetch(position, title, year):
+        result = await fetch_movie_poster(
+            client, semaphore, rate_limiter, title, None if pd.isna(year) else int(year), tmdb_api_key
+        )
+        return position, result
+    
+    async with httpx.AsyncClient(base_url=TMDB_API_BASE_URL, limits=limits, timeout=TMDB_TIMEOUT) as client:
+        tasks = [
+            asyncio.create_task(fetch(position, title, year))
+            for position, (title, year) in enumerate(zip(clean_titles, movies_df['year']))
+        ]
+        
+        # Handle lookups as they finish rather than waiting on the slowest of a batch
+        movies_processed = 0
+        for next_done in asyncio.as_completed(tasks):
+            position, (posters[position], backdrops[position], tmdb_ids[position]) = await next_done
+            
+            movies_processed += 1
+            if movies_processed % TMDB_PROGRESS_INTERVAL == 0:
+                logger.info(f"Processed {movies_processed}/{len(movies_df)} movies")
     
-    for i in range(0, len(movies_df), batch_size):
-        batch = movies_df.iloc[i:i+batch_size]
-        tasks = []
-        
-        for idx, row in batch.iterrows():
-            task = fetch_movie_poster(row['title'], row.get('year'), tmdb_api_key)
-            tasks.append(task)
-        
-        # Run batch of tasks
-        results = await asyncio.gather(*tasks)
-        
-        # Update dataframe with results
-        for j, (poster_path, backdrop_path, tmdb_id) in enumerate(results):
-            if i+j < len(movies_df):
-                movies_df.at[i+j, 'poster_path'] = poster_path
-                movies_df.at[i+j, 'backdrop_path'] = backdrop_path
-                movies_df.at[i+j, 'tmdb_id'] = tmdb_id
-        
-        movies_processed += len(batch)
-        logger.info(f"Processed {movies_processed}/{len(movies_df)} movies")
-        
-        # Rate limiting
-        await asyncio.sleep(rate_limit)
+    movies_df['poster_path'] = pd.Series(posters, index=movies_df.index, dtype=object)
+    movies_df['backdrop_path'] = pd.Series(backdrops, index=movies_df.index, dtype=object)
+    movies_df['tmdb_id'] = pd.array(tmdb_ids, dtype='Int64')
     
     # Log results
     poster_count = movies_df['poster_path'].notna().sum()
@@ -329,23 +436,61 @@ async def prepare_movies_with_posters(movies_df, tmdb_api_key=None):
     return movies_df
 
 
+def quantize_embeddings(embeddings):
+    """
+    Quantize a (n_movies, dim) embedding matrix to int8 with a per-vector scale
+    (value = q * scale), storing 1 byte per dimension instead of an 8-byte BSON double
+    
+    Returns:
+        Tuple of (list of bson.Binary int8 vectors, list of float scales)
+    """
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    scales = np.abs(matrix).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    quantized = np.round(matrix / scales[:, None]).astype(np.int8)
+    return [Binary(row.tobytes()) for row in quantized], scales.tolist()
+
+
 def prepare_movies_for_mongodb(movies_df):
     """
     Prepare movies data for loading into MongoDB
     """
+    # Pull each column out once instead of boxing every row into a Series
+    n_movies = len(movies_df)
+    # Nullable columns (e.g. Int64 year/tmdb_id) hold pd.NA, which BSON can't encode
+    optional_columns = [
+        movies_df[column].astype(object).where(movies_df[column].notna(), None).tolist()
+        if column in movies_df else [None] * n_movies
+        for column in ('poster_path', 'backdrop_path', 'tmdb_id', 'year')
+    ]
+    
+    # Quantize every embedding in one vectorized pass
+    embeddings_q, embedding_scales = quantize_embeddings(np.stack(movies_df['embedding'].tolist()))
+    
+    # One timestamp for the whole batch, in UTC like the rating timestamps
+    now = pd.Timestamp.now(tz="UTC")
+    
     movies = []
-    for _, row in movies_df.iterrows():
+    for movie_id, title, genres, embedding_q, embedding_scale, poster_path, backdrop_path, tmdb_id, year in zip(
+        movies_df['movieId'].astype(int).tolist(),
+        movies_df['title'].tolist(),
+        movies_df['genres'].tolist(),
+        embeddings_q,
+        embedding_scales,
+        *optional_columns
+    ):
         movie = {
-            "movieId_ml": int(row['movieId']),  # Original MovieLens ID
-            "title": row['title'],
-            "genres": row['genres'],
-            "embedding": row['embedding'],
-            "created_at": pd.Timestamp.now(),
-            "updated_at": pd.Timestamp.now(),
-            "poster_path": row.get('poster_path'),
-            "backdrop_path": row.get('backdrop_path'),
-            "tmdb_id": row.get('tmdb_id'),
-            "year": row.get('year')
+            "movieId_ml": movie_id,  # Original MovieLens ID
+            "title": title,
+            "genres": genres,
+            "embedding_q": embedding_q,
+            "embedding_scale": embedding_scale,
+            "created_at": now,
+            "updated_at": now,
+            "poster_path": poster_path,
+            "backdrop_path": backdrop_path,
+            "tmdb_id": tmdb_id,
+            "year": year
         }
         movies.append(movie)
     
@@ -356,46 +501,130 @@ def prepare_ratings_for_mongodb(ratings_df):
     """
     Prepare ratings data for loading into MongoDB as interactions
     """
-    interactions = []
-    for _, row in ratings_df.iterrows():
-        interaction = {
-            "userId": str(int(row['userId'])),  # Convert to string for consistent ID format
-            "movieId_ml": int(row['movieId']),  # We'll need to map this to MongoDB _id later
+    # Convert whole columns up front, then zip the plain values
+    user_ids = ratings_df['userId'].astype(int).astype(str).tolist()  # String for consistent ID format
+    movie_ids = ratings_df['movieId'].astype(int).tolist()  # We'll need to map this to MongoDB _id later
+    values = ratings_df['rating'].astype(float).tolist()
+    timestamps = pd.to_datetime(ratings_df['timestamp'], unit='s', utc=True).tolist()
+    
+    interactions = [
+        {
+            "userId": user_id,
+            "movieId_ml": movie_id,
             "type": "rate",
-            "value": float(row['rating']),
-            "timestamp": pd.Timestamp.fromtimestamp(row['timestamp'])
+            "value": value,
+            "timestamp": timestamp
         }
-        interactions.append(interaction)
+        for user_id, movie_id, value, timestamp in zip(user_ids, movie_ids, values, timestamps)
+    ]
     
     return interactions
 
 
-def load_to_mongodb(movies, interactions, mongodb_uri=MONGODB_URI):
+def _index_matches(index, existing):
+    """Check whether an existing index (from index_information) has the keys and options of an IndexModel"""
+    document = index.document
+    keys = list(document["key"].items())
+    # Text indexes are stored under internal _fts/_ftsx keys, so only their name can be compared
+    if TEXT not in dict(keys).values() and [tuple(key) for key in existing["key"]] != keys:
+        return False
+    return all(
+        bool(document.get(option)) == bool(existing.get(option))
+        for option in INDEX_OPTIONS_COMPARED
+    )
+
+
+def _ensure_indexes(collection, indexes):
+    """
+    Create whichever indexes are missing in a single createIndexes command,
+    dropping and recreating any whose keys or options have changed
+    (e.g. a non-unique movieId_ml_1 left by an older loader)
+    """
+    existing = collection.index_information()
+    missing = []
+    for index in indexes:
+        name = index.document["name"]
+        if name in existing and not _index_matches(index, existing[name]):
+            logger.info(f"Recreating index {name} on {collection.name} with updated options")
+            collection.drop_index(name)
+            del existing[name]
+        if name not in existing:
+            missing.append(index)
+    if missing:
+        collection.create_indexes(missing)
+
+
+def _upsert_movie(movie):
+    """Build an upsert for a movie keyed on its MovieLens ID, keeping the original created_at"""
+    fields = {key: value for key, value in movie.items() if key != "created_at"}
+    return UpdateOne(
+        {"movieId_ml": movie["movieId_ml"]},
+        {
+            "$set": fields,
+            "$setOnInsert": {"created_at": movie["created_at"]},
+            # Drop the legacy float embedding, which readers would otherwise prefer
+            "$unset": {"embedding": ""}
+        },
+        upsert=True
+    )
+
+
+def _upsert_interaction(interaction):
+    """Build an upsert for a rating keyed on (userId, movieId, timestamp)"""
+    return UpdateOne(
+        {
+            "userId": interaction["userId"],
+            "movieId": interaction["movieId"],
+            "timestamp": interaction["timestamp"]
+        },
+        {"$set": interaction},
+        upsert=True
+    )
+
+
+def load_to_mongodb(movies, interactions, mongodb_uri=MONGODB_URI, reset=False):
     """
     Load data into MongoDB
+    
+    Movies and interactions are upserted, so re-running the load is incremental.
+    Pass reset=True to clear both collections first.
     """
     if not mongodb_uri:
         logger.error("MONGODB_URI environment variable not set")
         return False
     
     try:
-        client = MongoClient(mongodb_uri)
+        # Bulk load: acknowledged but unjournaled writes
+        client = MongoClient(mongodb_uri, w=1, journal=False)
         db = client.get_database()
         
-        # Clear existing collections (optional, be careful in production)
-        db.movies.delete_many({})
-        db.interactions.delete_many({})
-        
-        # Insert movies
-        logger.info(f"Inserting {len(movies)} movies into MongoDB")
-        result = db.movies.insert_many(movies)
-        logger.info(f"Inserted {len(result.inserted_ids)} movies")
+        if reset:
+            logger.warning("Clearing existing movies and interactions")
+            db.movies.delete_many({})
+            db.interactions.delete_many({})
         
-        # Create a map of MovieLens IDs to MongoDB _ids
-        movie_id_map = {}
-        cursor = db.movies.find({}, {"_id": 1, "movieId_ml": 1})
-        for doc in cursor:
-            movie_id_map[doc["movieId_ml"]] = doc["_id"]
+        # Create indexes up front so the upserts below can use them
+        logger.info("Creating indexes")
+        _ensure_indexes(db.movies, MOVIE_INDEXES)
+        _ensure_indexes(db.interactions, INTERACTION_INDEXES)
+        
+        # Upsert movies
+        logger.info(f"Upserting {len(movies)} movies into MongoDB")
+        result = db.movies.bulk_write(
+            [_upsert_movie(movie) for movie in movies],
+            ordered=False,
+            bypass_document_validation=True
+        )
+        logger.info(f"Inserted {result.upserted_count} and updated {result.modified_count} movies")
+        
+        # Map MovieLens IDs to MongoDB _ids; newly inserted movies come back in the
+        # bulk result, so only movies that already existed need to be looked up
+        movie_id_map = {movies[index]["movieId_ml"]: _id for index, _id in result.upserted_ids.items()}
+        existing_ids = [movie["movieId_ml"] for movie in movies if movie["movieId_ml"] not in movie_id_map]
+        if existing_ids:
+            cursor = db.movies.find({"movieId_ml": {"$in": existing_ids}}, {"_id": 1, "movieId_ml": 1})
+            for doc in cursor:
+                movie_id_map[doc["movieId_ml"]] = doc["_id"]
         
         # Update interactions with MongoDB movie _ids
         valid_interactions = []
@@ -405,19 +634,15 @@ def load_to_mongodb(movies, interactions, mongodb_uri=MONGODB_URI):
                 interaction["movieId"] = str(movie_id_map[movieId_ml])
                 valid_interactions.append(interaction)
         
-        # Insert interactions
-        logger.info(f"Inserting {len(valid_interactions)} interactions into MongoDB")
-        result = db.interactions.insert_many(valid_interactions)
-        logger.info(f"Inserted {len(result.inserted_ids)} interactions")
-        
-        # Create indexes
-        logger.info("Creating indexes")
-        db.movies.create_index("movieId_ml")
-        db.movies.create_index("title")
-        db.movies.create_index([("title", "text")])
-        db.interactions.create_index("userId")
-        db.interactions.create_index("movieId")
-        db.interactions.create_index([("userId", 1), ("movieId", 1)])
+        # Upsert interactions
+        logger.info(f"Upserting {len(valid_interactions)} interactions into MongoDB")
+        if valid_interactions:
+            result = db.interactions.bulk_write(
+                [_upsert_interaction(interaction) for interaction in valid_interactions],
+                ordered=False,
+                bypass_document_validation=True
+            )
+            logger.info(f"Inserted {result.upserted_count} and updated {result.modified_count} interactions")
         
         return True
     except Exception as e:
@@ -431,6 +656,7 @@ async def main_async():
     
     parser = argparse.ArgumentParser(description="Process MovieLens dataset and generate embeddings")
     parser.add_argument("--force", action="store_true", help="Force processing even if data exists in MongoDB")
+    parser.add_argument("--reset", action="store_true", help="Delete existing movies and interactions before loading")
     args = parser.parse_args()
     
     if not MONGODB_URI:
@@ -483,18 +709,23 @@ async def main_async():
     # Get TMDB API key
     tmdb_api_key = os.getenv("TMDB_API_KEY")
     
-    # Enrich movies with poster data
-    movies_df = await prepare_movies_with_posters(movies_df, tmdb_api_key)
+    # Poster lookups are I/O-bound and embeddings are compute-bound, so run them side by side:
+    # posters on a copy in the event loop, embeddings in a worker thread
+    poster_task = asyncio.create_task(prepare_movies_with_posters(movies_df.copy(), tmdb_api_key))
+    movies_df = await asyncio.to_thread(generate_embeddings, movies_df)
+    poster_df = await poster_task
     
-    # Generate embeddings
-    movies_df = generate_embeddings(movies_df)
+    # Merge the poster columns back in by index
+    for column in POSTER_COLUMNS:
+        if column in poster_df:
+            movies_df[column] = poster_df[column]
     
     # Prepare data for MongoDB
     movies = prepare_movies_for_mongodb(movies_df)
     interactions = prepare_ratings_for_mongodb(ratings_df)
     
     # Load data into MongoDB
-    success = load_to_mongodb(movies, interactions)
+    success = load_to_mongodb(movies, interactions, reset=args.reset)
     
     if success:
         logger.info("Successfully processed MovieLens dataset and loaded into MongoDB")
@@ -7,10 +7,11 @@ without requiring additional libraries or generating embeddings.
 import os
 import json
 from pymongo import MongoClient
+from bson import Binary
 from datetime import datetime
 from dotenv import load_dotenv
 import sys
-import random
+import numpy as np
 
 # Load environment variables
 load_dotenv()
@@ -18,13 +19,18 @@ load_dotenv()
 # Constants
 MONGODB_URI = os.getenv("MONGODB_URI")
 TMDB_IMAGE_BASE_URL = "https://image.tmdb.org/t/p/w500"
+EMBEDDING_DIM = 384
 
 # Function to create dummy embedding vector
 def create_dummy_embedding(seed=None):
-    """Create a dummy embedding vector of 384 dimensions"""
-    if seed is not None:
-        random.seed(seed)
-    return [random.uniform(-0.1, 0.1) for _ in range(384)]
+    """
+    Create a dummy 384-dimension embedding, stored int8-quantized like the
+    processing pipeline does (embedding_q bytes plus a per-vector scale)
+    """
+    values = np.random.default_rng(seed).uniform(-0.1, 0.1, EMBEDDING_DIM).astype(np.float32)
+    scale = float(np.max(np.abs(values))) / 127.0
+    quantized = np.round(values / scale).astype(np.int8)
+    return {"embedding_q": Binary(quantized.tobytes()), "embedding_scale": scale}
 
 # Sample posters for popular movies (from TMDB)
 MOVIE_POSTERS = {
@@ -80,177 +86,66 @@ MOVIE_POSTERS = {
     }
 }
 
-# Sample movies data
-SAMPLE_MOVIES = [
-    {
-        "movieId_ml": 1,
-        "title": "Toy Story (1995)",
-        "genres": ["Adventure", "Animation", "Children", "Comedy", "Fantasy"],
-        "embedding": create_dummy_embedding(1),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Toy Story (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Toy Story (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Toy Story (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 2,
-        "title": "Jumanji (1995)",
-        "genres": ["Adventure", "Children", "Fantasy"],
-        "embedding": create_dummy_embedding(2),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Jumanji (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Jumanji (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Jumanji (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 3,
-        "title": "Grumpier Old Men (1995)",
-        "genres": ["Comedy", "Romance"],
-        "embedding": create_dummy_embedding(3),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Grumpier Old Men (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Grumpier Old Men (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Grumpier Old Men (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 4,
-        "title": "Waiting to Exhale (1995)",
-        "genres": ["Comedy", "Drama", "Romance"],
-        "embedding": create_dummy_embedding(4),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Waiting to Exhale (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Waiting to Exhale (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Waiting to Exhale (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 5,
-        "title": "Father of the Bride Part II (1995)",
-        "genres": ["Comedy"],
-        "embedding": create_dummy_embedding(5),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Father of the Bride Part II (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Father of the Bride Part II (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Father of the Bride Part II (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 6,
-        "title": "Heat (1995)",
-        "genres": ["Action", "Crime", "Thriller"],
-        "embedding": create_dummy_embedding(6),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Heat (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Heat (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Heat (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 7,
-        "title": "Sabrina (1995)",
-        "genres": ["Comedy", "Romance"],
-        "embedding": create_dummy_embedding(7),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Sabrina (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Sabrina (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Sabrina (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 8,
-        "title": "Tom and Huck (1995)",
-        "genres": ["Adventure", "Children"],
-        "embedding": create_dummy_embedding(8),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Tom and Huck (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Tom and Huck (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Tom and Huck (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 9,
-        "title": "Sudden Death (1995)",
-        "genres": ["Action"],
-        "embedding": create_dummy_embedding(9),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["Sudden Death (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["Sudden Death (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["Sudden Death (1995)"]["tmdb_id"],
-        "year": 1995
-    },
-    {
-        "movieId_ml": 10,
-        "title": "GoldenEye (1995)",
-        "genres": ["Action", "Adventure", "Thriller"],
-        "embedding": create_dummy_embedding(10),
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-        "poster_path": MOVIE_POSTERS["GoldenEye (1995)"]["poster_path"],
-        "backdrop_path": MOVIE_POSTERS["GoldenEye (1995)"]["backdrop_path"],
-        "tmdb_id": MOVIE_POSTERS["GoldenEye (1995)"]["tmdb_id"],
-        "year": 1995
-    }
+# Sample movies: (MovieLens ID, title, genres); all are from 1995
+_SAMPLE_MOVIE_DATA = [
+    (1, "Toy Story (1995)", ["Adventure", "Animation", "Children", "Comedy", "Fantasy"]),
+    (2, "Jumanji (1995)", ["Adventure", "Children", "Fantasy"]),
+    (3, "Grumpier Old Men (1995)", ["Comedy", "Romance"]),
+    (4, "Waiting to Exhale (1995)", ["Comedy", "Drama", "Romance"]),
+    (5, "Father of the Bride Part II (1995)", ["Comedy"]),
+    (6, "Heat (1995)", ["Action", "Crime", "Thriller"]),
+    (7, "Sabrina (1995)", ["Comedy", "Romance"]),
+    (8, "Tom and Huck (1995)", ["Adventure", "Children"]),
+    (9, "Sudden Death (1995)", ["Action"]),
+    (10, "GoldenEye (1995)", ["Action", "Adventure", "Thriller"]),
 ]
 
-# Sample ratings/interactions
-SAMPLE_INTERACTIONS = [
-    {
-        "userId": "1",
-        "movieId_ml": 1,
-        "type": "rate",
-        "value": 5.0,
-        "timestamp": datetime.now()
-    },
-    {
-        "userId": "1",
-        "movieId_ml": 3,
-        "type": "rate",
-        "value": 4.0,
-        "timestamp": datetime.now()
-    },
-    {
-        "userId": "2",
-        "movieId_ml": 1,
-        "type": "rate",
-        "value": 3.0,
-        "timestamp": datetime.now()
-    },
-    {
-        "userId": "2",
-        "movieId_ml": 2,
-        "type": "rate",
-        "value": 4.0,
-        "timestamp": datetime.now()
-    },
-    {
-        "userId": "3",
-        "movieId_ml": 5,
-        "type": "rate",
-        "value": 5.0,
-        "timestamp": datetime.now()
-    },
-    {
-        "userId": "3",
-        "movieId_ml": 6,
-        "type": "rate",
-        "value": 4.5,
-        "timestamp": datetime.now()
-    }
+# Sample ratings: (user ID, MovieLens ID, rating)
+_SAMPLE_RATING_DATA = [
+    ("1", 1, 5.0),
+    ("1", 3, 4.0),
+    ("2", 1, 3.0),
+    ("2", 2, 4.0),
+    ("3", 5, 5.0),
+    ("3", 6, 4.5),
 ]
 
 
+def _build_sample_movies(now=None):
+    """Build the sample movie documents, sharing one timestamp across the batch"""
+    now = now or datetime.now()
+    return [
+        {
+            "movieId_ml": movie_id,
+            "title": title,
+            "genres": list(genres),
+            **create_dummy_embedding(movie_id),
+            "created_at": now,
+            "updated_at": now,
+            "poster_path": MOVIE_POSTERS[title]["poster_path"],
+            "backdrop_path": MOVIE_POSTERS[title]["backdrop_path"],
+            "tmdb_id": MOVIE_POSTERS[title]["tmdb_id"],
+            "year": 1995
+        }
+        for movie_id, title, genres in _SAMPLE_MOVIE_DATA
+    ]
+
+
+def _build_sample_interactions(now=None):
+    """Build the sample rating documents, sharing one timestamp across the batch"""
+    now = now or datetime.now()
+    return [
+        {
+            "userId": user_id,
+            "movieId_ml": movie_id,
+            "type": "rate",
+            "value": value,
+            "timestamp": now
+        }
+        for user_id, movie_id, value in _SAMPLE_RATING_DATA
+    ]
+
+
 def load_to_mongodb(movies, interactions, mongodb_uri=MONGODB_URI):
     """
     Load sample data into MongoDB
@@ -293,7 +188,11 @@ def load_to_mongodb(movies, interactions, mongodb_uri=MONGODB_URI):
         
         # Create indexes
         print("Creating indexes")
-        db.movies.create_index("movieId_ml")
+        # Older loads created a non-unique movieId_ml_1, which would conflict with the unique one
+        existing = db.movies.index_information().get("movieId_ml_1")
+        if existing and not existing.get("unique"):
+            db.movies.drop_index("movieId_ml_1")
+        db.movies.create_index("movieId_ml", unique=True)
         db.movies.create_index("title")
         db.movies.create_index([("title", "text")])
         db.interactions.create_index("userId")
@@ -316,7 +215,8 @@ def load_sample_data(mongodb_uri=MONGODB_URI):
     Returns:
         bool: True if successful, False otherwise
     """
-    return load_to_mongodb(SAMPLE_MOVIES, SAMPLE_INTERACTIONS, mongodb_uri)
+    now = datetime.now()
+    return load_to_mongodb(_build_sample_movies(now), _build_sample_interactions(now), mongodb_uri)
 
 def main():
     """
@@ -1,38 +1,64 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-import time
 from loguru import logger
 from contextlib import asynccontextmanager
+import importlib.util
+import orjson
 import os
+import sys
 
 from .api.api import api_router
 from .core.config import settings
-from .core.database import connect_to_mongodb, close_mongodb_connection, init_redis
-from .core.init_db import ensure_movies_exist
+from .core.database import connect_to_datastores, close_mongodb_connection, close_redis_connection
+from .core.http_client import init_http_client, close_http_client
+from .core.middleware import TimingMiddleware, ProfilingMiddleware
+from .core.warmup import warm_up
 import uvicorn
 
+# Methods and request headers the API actually uses
+CORS_ALLOW_METHODS = ("GET", "POST")
+CORS_ALLOW_HEADERS = ("Authorization", "Content-Type")
+
+# How long browsers may cache a CORS preflight response
+CORS_MAX_AGE_SECONDS = 600
+
+# In production log through a single stderr sink fed from a background thread,
+# so writes never block the event loop, and skip the costly frame inspection
+if settings.ENV == "production":
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=settings.LOG_LEVEL,
+        enqueue=True,
+        backtrace=False,
+        diagnose=False,
+    )
+
 # Define lifespan for startup/shutdown events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: Initialize connections, etc.
     logger.info("Starting up MovieLens Recommender API")
-    await connect_to_mongodb()
-    await init_redis()
+    # Connect to MongoDB and Redis concurrently
+    await connect_to_datastores()
+    await init_http_client()
+    # Movie data is loaded once per deployment by `python -m app.core.init_db`
+    # (see entrypoint.sh), not here, since every worker process runs the lifespan
     
-    # Initialize database if needed
-    logger.info("Checking if movie data exists in database")
-    data_loaded = await ensure_movies_exist()
-    if data_loaded:
-        logger.info("Sample movie data has been loaded")
-    else:
-        logger.info("Using existing movie data")
+    # Pay first-use model and OpenAPI costs before taking traffic
+    warm_up(app)
     
     yield
     
     # Shutdown: Close connections, etc.
     logger.info("Shutting down MovieLens Recommender API")
     await close_mongodb_connection()
+    await close_redis_connection()
+    await close_http_client()
+    # Flush any records still queued for the background sink
+    await logger.complete()
 
 # Create FastAPI app
 app = FastAPI(
@@ -40,28 +66,51 @@ app = FastAPI(
     description=settings.PROJECT_DESCRIPTION,
     version=settings.API_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     openapi_url=f"{settings.API_PREFIX}/openapi.json",
     docs_url=f"{settings.API_PREFIX}/docs",
     redoc_url=f"{settings.API_PREFIX}/redoc",
 )
 
-# Configure CORS
+# Serve the OpenAPI document from bytes encoded once (see warm_up) instead of
+# re-encoding the schema dict on every docs load
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != app.openapi_url
+]
+
+
+@app.get(app.openapi_url, include_in_schema=False)
+async def openapi_json():
+    body = getattr(app.state, "openapi_bytes", None)
+    if body is None:
+        body = app.state.openapi_bytes = orjson.dumps(app.openapi())
+    return Response(content=body, media_type="application/json")
+
+
+# Configure CORS with explicit methods and headers so Starlette builds the
+# preflight response headers once, and browsers may cache preflights
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_ALLOW_METHODS,
+    allow_headers=CORS_ALLOW_HEADERS,
+    max_age=CORS_MAX_AGE_SECONDS,
 )
 
 # Add request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+if settings.TIMING_ENABLED:
+    app.add_middleware(TimingMiddleware)
+
+# Add on-demand request profiling; off by default so production pays nothing
+if settings.PROFILING_ENABLED:
+    # Starlette builds the middleware stack on the first request, so a missing
+    # pyinstrument would otherwise fail every request rather than startup
+    if importlib.util.find_spec("pyinstrument") is not None:
+        app.add_middleware(ProfilingMiddleware)
+    else:
+        logger.warning("PROFILING_ENABLED is set but pyinstrument is not installed, profiling disabled")
 
 # Include API router
 app.include_router(api_router, prefix=settings.API_PREFIX)
@@ -74,18 +123,33 @@ if os.path.exists(static_dir):
 else:
     logger.warning(f"Static directory not found at {static_dir}")
 
+# The root payload never changes, so encode it once at import
+_ROOT_BODY = orjson.dumps({
+    "message": "Welcome to MovieLens Recommender API",
+    "documentation": f"{settings.API_PREFIX}/docs"
+})
+
 # Root endpoint
 @app.get("/")
 async def root():
     """
     Root endpoint - redirects to API documentation
     """
-    return {
-        "message": "Welcome to MovieLens Recommender API",
-        "documentation": f"{settings.API_PREFIX}/docs"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import os
     port = int(os.environ.get("PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
+    # Prefer uvloop and httptools; fall back to the pure-Python implementations
+    # where they aren't installed (uvloop doesn't support Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    uvicorn.run(app, host="0.0.0.0", port=port, loop=loop, http=http)
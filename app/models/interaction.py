@@ -1,10 +1,15 @@
 from pydantic import BaseModel, Field
 from typing import Optional, Literal
-from datetime import datetime
+from datetime import datetime, timezone
 from bson import ObjectId
 from .movie import PyObjectId
 
 
+def _utcnow() -> datetime:
+    """Timezone-aware replacement for the deprecated datetime.utcnow"""
+    return datetime.now(timezone.utc)
+
+
 class InteractionBase(BaseModel):
     """Base Interaction model with common fields"""
     userId: Optional[str] = None  # Make userId optional since we'll get it from token
@@ -14,14 +19,11 @@ class InteractionBase(BaseModel):
     
     class Config:
         arbitrary_types_allowed = True
-        json_encoders = {
-            ObjectId: str
-        }
 
 
 class InteractionCreate(InteractionBase):
     """Model for creating an interaction"""
-    timestamp: Optional[datetime] = Field(default_factory=datetime.utcnow)
+    timestamp: Optional[datetime] = Field(default_factory=_utcnow)
 
 
 class InteractionRead(InteractionBase):
@@ -44,15 +46,11 @@ class InteractionRead(InteractionBase):
 class InteractionInDB(InteractionBase):
     """Interaction model as stored in database"""
     id: PyObjectId = Field(default_factory=PyObjectId, alias="_id")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     
     class Config:
         populate_by_name = True
         arbitrary_types_allowed = True
-        json_encoders = {
-            ObjectId: str,
-            datetime: lambda dt: dt.isoformat()
-        }
 
 
 class InteractionResponse(InteractionBase):
@@ -62,6 +60,4 @@ class InteractionResponse(InteractionBase):
     
     class Config:
         populate_by_name = True
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        } 
\ No newline at end of file
+ 
\ No newline at end of file
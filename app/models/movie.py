@@ -1,26 +1,41 @@
-from pydantic import BaseModel, Field, GetJsonSchemaHandler
+from pydantic import BaseModel, Field, GetCoreSchemaHandler, GetJsonSchemaHandler
 from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
 from typing import List, Optional, Dict, Any, Annotated
 from datetime import datetime
 from bson import ObjectId
+from bson.errors import InvalidId
 
 
 class PyObjectId(ObjectId):
     """Custom ObjectId type for Pydantic models"""
     
     @classmethod
-    def __get_validators__(cls):
-        yield cls.validate
+    def __get_pydantic_core_schema__(
+        cls, _source_type: Any, _handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Validate with a single parse and serialize to a string in JSON mode."""
+        return core_schema.no_info_plain_validator_function(
+            cls.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(str, when_used="json"),
+        )
 
     @classmethod
     def validate(cls, v):
-        if not ObjectId.is_valid(v):
+        # ObjectIds straight from Motor need no parsing; strings are parsed once
+        if isinstance(v, ObjectId):
+            return v
+        # ObjectId(None) would silently generate a new id
+        if v is None:
+            raise ValueError("Invalid ObjectId")
+        try:
+            return ObjectId(v)
+        except (InvalidId, TypeError):
             raise ValueError("Invalid ObjectId")
-        return ObjectId(v)
 
     @classmethod
     def __get_pydantic_json_schema__(
-        cls, _schema_generator: GetJsonSchemaHandler
+        cls, _core_schema: core_schema.CoreSchema, _handler: GetJsonSchemaHandler
     ) -> JsonSchemaValue:
         """Return the JSON Schema representation for the ObjectId."""
         return {"type": "string"}
@@ -37,9 +52,6 @@ class MovieBase(BaseModel):
     
     class Config:
         arbitrary_types_allowed = True
-        json_encoders = {
-            ObjectId: str
-        }
 
 
 class MovieCreate(MovieBase):
@@ -54,9 +66,6 @@ class MovieInDB(MovieBase):
     
     class Config:
         populate_by_name = True
-        json_encoders = {
-            ObjectId: str
-        }
         json_schema_extra = {
             "example": {
                 "id": "507f1f77bcf86cd799439011",
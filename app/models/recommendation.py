@@ -1,9 +1,14 @@
 from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from .movie import MovieResponse
 
 
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
 class Recommendation(BaseModel):
     """Single movie recommendation with score"""
     movie: MovieResponse
@@ -33,24 +38,14 @@ class UserRecommendationResponse(BaseModel):
     """Response model for user recommendations"""
     userId: str
     recommendations: List[Recommendation]
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
+    generated_at: datetime = Field(default_factory=_utcnow)
 
 
 class ItemRecommendationResponse(BaseModel):
     """Response model for item (movie) recommendations"""
     movieId: str
     similar_items: List[RecommendationResponse]
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda dt: dt.isoformat()
-        }
+    generated_at: datetime = Field(default_factory=_utcnow)
 
 
 class RecommendationListResponse(BaseModel):
@@ -13,7 +13,6 @@ from ..data_access.mongo_client import MovieRepository, InteractionRepository
 from ..data_access.redis_client import CacheRepository
 from ..models.movie import MovieResponse
 from ..models.recommendation import RecommendationResponse
-from scipy.spatial.distance import cosine
 from ..core.exceptions import RecommendationServiceError
 
 
@@ -91,10 +90,10 @@ class AdvancedRecommendationService:
         try:
             # Check cache first
             cache_key = f"similar:db:{movie_id}:{limit}"
-            cached_recommendations = self.cache_repo.get_json(cache_key)
+            cached_recommendations = await self.cache_repo.get_json(cache_key)
             
             if cached_recommendations:
-                logger.debug(f"Cache hit for similar movies: {cache_key}")
+                logger.debug("Cache hit for similar movies: {}", cache_key)
                 return [MovieResponse(**movie) for movie in cached_recommendations]
             
             # Query MongoDB for pre-computed similarities
@@ -135,7 +134,7 @@ class AdvancedRecommendationService:
             
             # Cache the results
             if recommendations:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in recommendations],
                     settings.RECOMMENDATIONS_CACHE_TTL
@@ -172,10 +171,10 @@ class AdvancedRecommendationService:
             
             # Check cache first
             cache_key = f"recommendations:cf:user:{user_id}:{limit}:{exclude_seen}"
-            cached_recommendations = self.cache_repo.get_json(cache_key)
+            cached_recommendations = await self.cache_repo.get_json(cache_key)
             
             if cached_recommendations:
-                logger.debug(f"Cache hit for CF recommendations: {cache_key}")
+                logger.debug("Cache hit for CF recommendations: {}", cache_key)
                 return [MovieResponse(**movie) for movie in cached_recommendations]
                 
             # Get movies the user has already seen/rated
@@ -205,7 +204,7 @@ class AdvancedRecommendationService:
                 if user_id not in self.cf_mappings['user_id_map']:
                     # If we don't have this user in our training data, 
                     # fallback to content-based recommendations
-                    logger.debug(f"User {user_id} not found in CF model. Using content-based fallback.")
+                    logger.debug("User {} not found in CF model. Using content-based fallback.", user_id)
                     return await self.get_content_based_recommendations(user_id, limit, exclude_seen)
                 
                 # Predict rating
@@ -246,7 +245,7 @@ class AdvancedRecommendationService:
             
             # Cache the results
             if recommendations:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in recommendations],
                     settings.RECOMMENDATIONS_CACHE_TTL
@@ -280,10 +279,10 @@ class AdvancedRecommendationService:
         try:
             # Check cache first
             cache_key = f"recommendations:cb:user:{user_id}:{limit}:{exclude_seen}"
-            cached_recommendations = self.cache_repo.get_json(cache_key)
+            cached_recommendations = await self.cache_repo.get_json(cache_key)
             
             if cached_recommendations:
-                logger.debug(f"Cache hit for CB recommendations: {cache_key}")
+                logger.debug("Cache hit for CB recommendations: {}", cache_key)
                 return [MovieResponse(**movie) for movie in cached_recommendations]
                 
             # Get user's interactions
@@ -356,7 +355,7 @@ class AdvancedRecommendationService:
             
             # Cache the results
             if recommendations:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in recommendations],
                     settings.RECOMMENDATIONS_CACHE_TTL
@@ -394,10 +393,10 @@ class AdvancedRecommendationService:
             
             # Check cache first
             cache_key = f"recommendations:hybrid:user:{user_id}:{limit}:{exclude_seen}"
-            cached_recommendations = self.cache_repo.get_json(cache_key)
+            cached_recommendations = await self.cache_repo.get_json(cache_key)
             
             if cached_recommendations:
-                logger.debug(f"Cache hit for hybrid recommendations: {cache_key}")
+                logger.debug("Cache hit for hybrid recommendations: {}", cache_key)
                 return [MovieResponse(**movie) for movie in cached_recommendations]
             
             # Get recommendations from each model
@@ -464,7 +463,7 @@ class AdvancedRecommendationService:
             
             # Cache the results
             if recommendations:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in recommendations],
                     settings.RECOMMENDATIONS_CACHE_TTL
@@ -490,10 +489,10 @@ class AdvancedRecommendationService:
         try:
             # Check cache first
             cache_key = f"recommendations:popular:{limit}"
-            cached_recommendations = self.cache_repo.get_json(cache_key)
+            cached_recommendations = await self.cache_repo.get_json(cache_key)
             
             if cached_recommendations:
-                logger.debug(f"Cache hit for popular movies: {cache_key}")
+                logger.debug("Cache hit for popular movies: {}", cache_key)
                 return [MovieResponse(**movie) for movie in cached_recommendations]
             
             # Get most rated movies
@@ -520,7 +519,7 @@ class AdvancedRecommendationService:
             
             # Cache the results
             if recommendations:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in recommendations],
                     settings.POPULAR_ITEMS_CACHE_TTL  # Use longer TTL for popular items
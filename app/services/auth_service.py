@@ -1,9 +1,12 @@
-import httpx
 from loguru import logger
 from ..core.config import settings
+from ..core.auth_cache import TokenCache
+from ..core.exceptions import AuthenticationError
+from ..core.http_client import get_http_client
 from typing import Dict, Any, Optional, Tuple
 import json
 import asyncio
+import time
 import jwt
 from datetime import datetime, timedelta
 
@@ -11,6 +14,33 @@ SUPABASE_URL = settings.SUPABASE_URL
 SUPABASE_ANON_KEY = settings.SUPABASE_ANON_KEY
 SUPABASE_SERVICE_ROLE_KEY = settings.SUPABASE_SERVICE_ROLE_KEY
 
+# Recently verified token payloads, keyed on the token digest
+token_cache = TokenCache()
+
+# User details change rarely, so /auth/me reuses them for a short while
+USER_DETAILS_CACHE_TTL = 30  # seconds
+USER_DETAILS_CACHE_MAX_ENTRIES = 10_000
+_user_details_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _get_cached_user_details(user_id: str) -> Optional[Dict[str, Any]]:
+    entry = _user_details_cache.get(user_id)
+    if entry is None:
+        return None
+    expires_at, details = entry
+    if expires_at <= time.monotonic():
+        _user_details_cache.pop(user_id, None)
+        return None
+    return details
+
+
+def _cache_user_details(user_id: str, details: Dict[str, Any]):
+    _user_details_cache.pop(user_id, None)
+    _user_details_cache[user_id] = (time.monotonic() + USER_DETAILS_CACHE_TTL, details)
+    # Dicts keep insertion order, so the first key is the oldest entry
+    while len(_user_details_cache) > USER_DETAILS_CACHE_MAX_ENTRIES:
+        _user_details_cache.pop(next(iter(_user_details_cache)))
+
 
 async def register_user(email: str, password: str, metadata: Optional[Dict[str, Any]] = None) -> Tuple[bool, Dict[str, Any]]:
     """
@@ -32,7 +62,7 @@ async def register_user(email: str, password: str, metadata: Optional[Dict[str,
             return False, {"error": "Authentication service not properly configured"}
         
         logger.info(f"Attempting to register user with email: {email}")
-        logger.debug(f"Using Supabase URL: {settings.SUPABASE_URL}")
+        logger.debug("Using Supabase URL: {}", settings.SUPABASE_URL)
         
         # For testing when Supabase connection fails
         if settings.ENV == "development" or settings.ENV == "test":
@@ -63,16 +93,16 @@ async def register_user(email: str, password: str, metadata: Optional[Dict[str,
         
         while retry_count < max_retries:
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.post(
-                        f"{settings.SUPABASE_URL}/auth/v1/admin/users",
-                        json=signup_data,
-                        headers={
-                            "apikey": settings.SUPABASE_KEY,
-                            "Authorization": f"Bearer {settings.SUPABASE_SERVICE_ROLE_KEY}"
-                        }
-                    )
-                    
+                client = get_http_client()
+                response = await client.post(
+                    f"{settings.SUPABASE_URL}/auth/v1/admin/users",
+                    json=signup_data,
+                    headers={
+                        "apikey": settings.SUPABASE_KEY,
+                        "Authorization": f"Bearer {settings.SUPABASE_SERVICE_ROLE_KEY}"
+                    }
+                )
+                
                 if response.status_code == 200:
                     user_data = response.json()
                     logger.info(f"Successfully registered user: {email}")
@@ -143,16 +173,16 @@ async def login_user(email: str, password: str) -> Tuple[bool, Dict[str, Any]]:
         
         while retry_count < max_retries:
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.post(
-                        f"{settings.SUPABASE_URL}/auth/v1/token?grant_type=password",
-                        json=login_data,
-                        headers={
-                            "apikey": settings.SUPABASE_KEY,
-                            "Content-Type": "application/json"
-                        }
-                    )
-                    
+                client = get_http_client()
+                response = await client.post(
+                    f"{settings.SUPABASE_URL}/auth/v1/token?grant_type=password",
+                    json=login_data,
+                    headers={
+                        "apikey": settings.SUPABASE_KEY,
+                        "Content-Type": "application/json"
+                    }
+                )
+                
                 if response.status_code == 200:
                     session_data = response.json()
                     logger.info(f"Successfully logged in user: {email}")
@@ -175,7 +205,7 @@ async def login_user(email: str, password: str) -> Tuple[bool, Dict[str, Any]]:
         return False, {"error": f"Login failed due to server error: {str(e)}"}
 
 
-async def verify_token(token: str) -> Tuple[bool, Dict[str, Any]]:
+async def verify_token(token: str) -> Dict[str, Any]:
     """
     Verify a JWT token and return the claims if valid
     
@@ -183,44 +213,46 @@ async def verify_token(token: str) -> Tuple[bool, Dict[str, Any]]:
         token: The JWT token to verify
         
     Returns:
-        Tuple of (is_valid, claims)
-        - If is_valid is True, claims contains the token payload
-        - If is_valid is False, claims contains error information
+        The token payload (claims)
+        
+    Raises:
+        AuthenticationError: If the token is missing, invalid or cannot be verified
     """
+    if not token:
+        raise AuthenticationError("No token provided")
+        
+    if not settings.SECRET_KEY:
+        logger.error("JWT secret key not configured")
+        raise AuthenticationError("Authentication configuration error")
+        
+    # For development or testing environment
+    if settings.ENV == "development" or settings.ENV == "test":
+        # Simple verification for development - just check if token exists
+        logger.info("Development mode: Simulating successful token verification")
+        # Create mock payload
+        return {
+            "sub": "user123",  # Subject (user id)
+            "email": "test@example.com",
+            "exp": datetime.utcnow().timestamp() + 3600  # Expiry
+        }
+        
+    payload = token_cache.get(token)
+    if payload is not None:
+        return payload
+        
+    # Verify the token
     try:
-        if not token:
-            return False, {"error": "No token provided"}
-            
-        if not settings.SECRET_KEY:
-            logger.error("JWT secret key not configured")
-            return False, {"error": "Authentication configuration error"}
-            
-        # For development or testing environment
-        if settings.ENV == "development" or settings.ENV == "test":
-            # Simple verification for development - just check if token exists
-            logger.info("Development mode: Simulating successful token verification")
-            # Create mock payload
-            return True, {
-                "sub": "user123",  # Subject (user id)
-                "email": "test@example.com",
-                "exp": datetime.utcnow().timestamp() + 3600  # Expiry
-            }
-            
-        # Verify the token
-        try:
-            payload = jwt.decode(
-                token, 
-                settings.SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
-            )
-            return True, payload
-        except jwt.PyJWTError as e:
-            logger.error(f"Token verification failed: {str(e)}")
-            return False, {"error": "Invalid authentication token"}
-            
-    except Exception as e:
-        logger.error(f"Unexpected error verifying token: {str(e)}")
-        return False, {"error": f"Authentication error: {str(e)}"}
+        payload = jwt.decode(
+            token, 
+            settings.SECRET_KEY,
+            algorithms=[settings.JWT_ALGORITHM]
+        )
+    except jwt.PyJWTError as e:
+        logger.opt(lazy=True).error("Token verification failed: {}", lambda: str(e))
+        raise AuthenticationError("Invalid authentication token") from e
+        
+    token_cache.set(token, payload)
+    return payload
 
 
 async def get_user_details(user_id: str) -> Dict[str, Any]:
@@ -232,7 +264,13 @@ async def get_user_details(user_id: str) -> Dict[str, Any]:
         
     Returns:
         Dictionary containing user details
+        
+    Successful lookups are cached for USER_DETAILS_CACHE_TTL seconds.
     """
+    cached = _get_cached_user_details(user_id)
+    if cached is not None:
+        return cached
+    
     try:
         if not settings.SUPABASE_URL or not settings.SUPABASE_SERVICE_ROLE_KEY:
             logger.error("Supabase URL or service role key not configured")
@@ -253,15 +291,15 @@ async def get_user_details(user_id: str) -> Dict[str, Any]:
             }
         
         # Make request to Supabase Auth API with service role key
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{settings.SUPABASE_URL}/auth/v1/admin/users/{user_id}",
-                headers={
-                    "apikey": settings.SUPABASE_KEY,
-                    "Authorization": f"Bearer {settings.SUPABASE_SERVICE_ROLE_KEY}"
-                }
-            )
-            
+        client = get_http_client()
+        response = await client.get(
+            f"{settings.SUPABASE_URL}/auth/v1/admin/users/{user_id}",
+            headers={
+                "apikey": settings.SUPABASE_KEY,
+                "Authorization": f"Bearer {settings.SUPABASE_SERVICE_ROLE_KEY}"
+            }
+        )
+        
         if response.status_code == 200:
             user_data = response.json()
             logger.info(f"Successfully retrieved user details for {user_id}")
@@ -276,6 +314,7 @@ async def get_user_details(user_id: str) -> Dict[str, Any]:
                 "created_at": user_data.get("created_at")
             }
             
+            _cache_user_details(user_id, result)
             return result
         else:
             error_data = response.json()
@@ -3,7 +3,7 @@ from bson import ObjectId
 from loguru import logger
 from ..core.database import get_database, get_redis
 from ..models.interaction import InteractionCreate, InteractionInDB
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 from ..data_access.mongo_client import InteractionRepository
 from ..data_access.redis_client import CacheRepository
@@ -35,10 +35,10 @@ class InteractionService:
                 "movie_id": interaction_data.movieId,
                 "type": interaction_data.type,
                 "value": interaction_data.value,
-                "timestamp": datetime.utcnow()
+                "timestamp": datetime.now(timezone.utc)
             }
             
-            logger.debug(f"Creating interaction: {interaction_doc}")
+            logger.debug("Creating interaction: {}", interaction_doc)
             
             # Save to database
             result_id = await self.interaction_repo.create_interaction(interaction_doc)
@@ -48,7 +48,7 @@ class InteractionService:
                 
             # Invalidate cached recommendations for this user - handle potential Redis failures
             try:
-                self.cache_repo.delete_pattern(f"recommendations:user:{effective_user_id}:*")
+                await self.cache_repo.delete_pattern(f"recommendations:user:{effective_user_id}:*")
             except Exception as cache_error:
                 logger.warning(f"Failed to invalidate cache: {cache_error}")
                 # Continue execution even if cache invalidation fails
@@ -64,7 +64,7 @@ class InteractionService:
             }
             
             # Log the response document for debugging
-            logger.debug(f"Response document: {response_doc}")
+            logger.debug("Response document: {}", response_doc)
             
             return response_doc
             
@@ -112,7 +112,7 @@ async def get_user_rated_movies(user_id: str, min_rating: float = 3.5, limit: in
     db = get_database()
     
     # Log the query for debugging
-    logger.debug(f"Querying highly rated movies for user_id: {user_id}, min_rating: {min_rating}")
+    logger.debug("Querying highly rated movies for user_id: {}, min_rating: {}", user_id, min_rating)
     
     cursor = db.interactions.find(
         {
@@ -127,7 +127,7 @@ async def get_user_rated_movies(user_id: str, min_rating: float = 3.5, limit: in
     result = [interaction["movie_id"] for interaction in interactions if "movie_id" in interaction]
     
     # Log the number of movies found
-    logger.debug(f"Found {len(result)} highly rated movies for user: {user_id}")
+    logger.debug("Found {} highly rated movies for user: {}", len(result), user_id)
     
     return result
 
@@ -139,7 +139,7 @@ async def get_user_viewed_movies(user_id: str) -> List[str]:
     db = get_database()
     
     # Log the query for debugging
-    logger.debug(f"Querying all viewed movies for user_id: {user_id}")
+    logger.debug("Querying all viewed movies for user_id: {}", user_id)
     
     cursor = db.interactions.find(
         {"user_id": user_id},
@@ -150,6 +150,6 @@ async def get_user_viewed_movies(user_id: str) -> List[str]:
     result = [interaction["movie_id"] for interaction in interactions if "movie_id" in interaction]
     
     # Log the number of movies found
-    logger.debug(f"Found {len(result)} viewed movies for user: {user_id}")
+    logger.debug("Found {} viewed movies for user: {}", len(result), user_id)
     
     return result 
\ No newline at end of file
@@ -10,14 +10,14 @@ import json
 from ..data_access.mongo_client import MovieRepository
 from ..data_access.redis_client import CacheRepository
 from ..core.exceptions import MovieNotFoundError
-import os
+from ..utils.helpers import EMBEDDING_FIELDS, decode_embedding
 
 
 class MovieService:
     def __init__(self):
         self.movie_repo = MovieRepository()
         self.cache_repo = CacheRepository()
-        self.image_base_url = os.getenv("TMDB_IMAGE_BASE_URL", "https://image.tmdb.org/t/p/w500")
+        self.image_base_url = settings.TMDB_IMAGE_BASE_URL
     
     def _get_full_poster_url(self, poster_path: Optional[str]) -> Optional[str]:
         """Create a full poster URL from a relative path"""
@@ -46,10 +46,10 @@ class MovieService:
             print(f"MovieService.get_movies called with skip={skip}, limit={limit}")
             # Try to get from cache first
             cache_key = f"movies:list:{skip}:{limit}"
-            cached_data = self.cache_repo.get_json(cache_key)
+            cached_data = await self.cache_repo.get_json(cache_key)
             if cached_data:
-                logger.debug(f"Cache hit for {cache_key}")
-                return [MovieResponse(**movie) for movie in cached_data]
+                logger.debug("Cache hit for {}", cache_key)
+                return [MovieResponse.model_construct(**movie) for movie in cached_data]
             
             # If not in cache, query repository
             print("Getting movies from repository...")
@@ -77,14 +77,14 @@ class MovieService:
                         "backdrop_url": self._get_full_backdrop_url(movie.get("backdrop_path"))
                     }
                     print(f"Creating MovieResponse for movie: {movie['title']} with id: {movie_dict['id']}")
-                    movie_response = MovieResponse(**movie_dict)
+                    movie_response = MovieResponse.model_construct(**movie_dict)
                     movies.append(movie_response)
                 except Exception as e:
                     print(f"Error creating MovieResponse: {str(e)}, movie data: {movie}")
             
             # Cache the result
             if movies:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in movies],
                     settings.MOVIE_CACHE_TTL if hasattr(settings, "MOVIE_CACHE_TTL") else 3600
@@ -116,10 +116,10 @@ class MovieService:
         try:
             # Try to get from cache first
             cache_key = f"movies:id:{movie_id}"
-            cached_data = self.cache_repo.get_json(cache_key)
+            cached_data = await self.cache_repo.get_json(cache_key)
             if cached_data:
-                logger.debug(f"Cache hit for {cache_key}")
-                return MovieResponse(**cached_data)
+                logger.debug("Cache hit for {}", cache_key)
+                return MovieResponse.model_construct(**cached_data)
             
             # If not in cache, query repository
             movie = await self.movie_repo.get_by_id(movie_id)
@@ -140,10 +140,10 @@ class MovieService:
                 "backdrop_url": self._get_full_backdrop_url(movie.get("backdrop_path"))
             }
             
-            movie_response = MovieResponse(**movie_dict)
+            movie_response = MovieResponse.model_construct(**movie_dict)
             
             # Cache the result
-            self.cache_repo.set_json(
+            await self.cache_repo.set_json(
                 cache_key,
                 movie_response.dict(),
                 settings.MOVIE_CACHE_TTL if hasattr(settings, "MOVIE_CACHE_TTL") else 3600
@@ -176,10 +176,10 @@ class MovieService:
         try:
             # Try to get from cache first (lowercase query for case insensitivity)
             cache_key = f"movies:search:{query.lower()}:{skip}:{limit}"
-            cached_data = self.cache_repo.get_json(cache_key)
+            cached_data = await self.cache_repo.get_json(cache_key)
             if cached_data:
-                logger.debug(f"Cache hit for {cache_key}")
-                return [MovieResponse(**movie) for movie in cached_data]
+                logger.debug("Cache hit for {}", cache_key)
+                return [MovieResponse.model_construct(**movie) for movie in cached_data]
             
             # If not in cache, query repository
             movies_data = await self.movie_repo.search_movies(query, skip, limit)
@@ -194,14 +194,14 @@ class MovieService:
                         "genres": movie["genres"],
                         "year": movie.get("year")
                     }
-                    movie_response = MovieResponse(**movie_dict)
+                    movie_response = MovieResponse.model_construct(**movie_dict)
                     movies.append(movie_response)
                 except Exception as e:
                     print(f"Error creating MovieResponse during search: {str(e)}")
             
             # Cache the result
             if movies:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in movies],
                     60 * 60  # 1 hour TTL
@@ -227,12 +227,10 @@ async def get_movie_embedding(movie_id: str) -> Optional[List[float]]:
     try:
         result = await db.movies.find_one(
             {"_id": ObjectId(movie_id)},
-            {"embedding": 1}
+            {field: 1 for field in EMBEDDING_FIELDS}
         )
         
-        if result and "embedding" in result:
-            return result["embedding"]
-        return None
+        return decode_embedding(result)
     except Exception as e:
         logger.error(f"Error retrieving movie embedding for {movie_id}: {e}")
         return None 
\ No newline at end of file
@@ -7,15 +7,17 @@ import base64
 from ..core.config import settings
 from ..core.database import get_database
 import httpx
-import time
-from google.cloud import pubsub_v1
+import asyncio
+import importlib.util
+from functools import lru_cache
 
-# Check if google-cloud-pubsub is available
+# Check if google-cloud-pubsub is available without importing it; the client library is
+# slow to import, so it's only loaded the first time a message is published
 try:
-    from google.cloud import pubsub_v1
-    PUBSUB_AVAILABLE = True
+    PUBSUB_AVAILABLE = importlib.util.find_spec("google.cloud.pubsub_v1") is not None
 except ImportError:
     PUBSUB_AVAILABLE = False
+if not PUBSUB_AVAILABLE:
     logger.warning("google-cloud-pubsub package not installed, pub/sub trigger will be disabled")
 
 # Default values and environment variables
@@ -32,6 +34,13 @@ if not PROJECT_ID and settings.GCS_BUCKET_NAME:
         logger.warning("Could not extract project ID from bucket name")
 
 
+@lru_cache(maxsize=1)
+def _get_publisher():
+    """Import Pub/Sub and create the shared publisher client on first use"""
+    from google.cloud import pubsub_v1
+    return pubsub_v1.PublisherClient()
+
+
 async def check_if_pipeline_needed() -> bool:
     """
     Check if the data pipeline needs to be executed by checking if movies collection exists and has data
@@ -100,7 +109,7 @@ async def trigger_data_pipeline(user_id: str, email: str) -> bool:
     if PUBSUB_AVAILABLE and PROJECT_ID and PUBSUB_TOPIC:
         try:
             # Initialize Pub/Sub publisher client
-            publisher = pubsub_v1.PublisherClient()
+            publisher = _get_publisher()
             topic_name = f"projects/{PROJECT_ID}/topics/{PUBSUB_TOPIC}"
             
             # Convert message to bytes
@@ -122,7 +131,7 @@ async def trigger_data_pipeline(user_id: str, email: str) -> bool:
     logger.info("Using fallback/simulated pipeline trigger for testing")
     try:
         # Simulate processing delay
-        time.sleep(0.5)
+        await asyncio.sleep(0.5)
         
         # Log success simulation
         logger.info(f"Successfully triggered pipeline process (simulated) for user: {user_id}")
@@ -157,7 +166,7 @@ class PipelineTriggerService:
                 return False
                 
             # Create a publisher client
-            publisher = pubsub_v1.PublisherClient()
+            publisher = _get_publisher()
             topic_path = publisher.topic_path(self.project_id, self.topic_id)
             
             # Create message data
@@ -11,8 +11,18 @@ from ..data_access.mongo_client import MovieRepository, InteractionRepository
 from ..data_access.redis_client import CacheRepository
 from ..models.movie import MovieResponse
 from ..models.recommendation import RecommendationResponse
-from scipy.spatial.distance import cosine
 from ..core.exceptions import RecommendationServiceError
+from ..utils.helpers import EMBEDDING_FIELDS, decode_embedding
+
+# Projections that leave out / keep only the (possibly quantized) embedding fields
+_NO_EMBEDDING_PROJECTION = {field: 0 for field in EMBEDDING_FIELDS}
+_CANDIDATE_PROJECTION = {"title": 1, "genres": 1, "movieId_ml": 1, **{field: 1 for field in EMBEDDING_FIELDS}}
+
+
+def _cosine(u, v):
+    """Cosine distance; scipy is imported on first use to keep it off the app's startup import path"""
+    from scipy.spatial.distance import cosine
+    return cosine(u, v)
 
 
 class RecommendationService:
@@ -40,41 +50,41 @@ class RecommendationService:
         """
         try:
             # Add debug logging
-            logger.debug(f"Getting recommendations for user_id: {user_id}, limit: {limit}, exclude_seen: {exclude_seen}")
+            logger.debug("Getting recommendations for user_id: {}, limit: {}, exclude_seen: {}", user_id, limit, exclude_seen)
             
             # Check cache first
             cache_key = f"recommendations:user:{user_id}:{limit}:{exclude_seen}"
-            cached_recommendations = self.cache_repo.get_json(cache_key)
+            cached_recommendations = await self.cache_repo.get_json(cache_key)
             
             if cached_recommendations:
-                logger.debug(f"Cache hit for recommendations: {cache_key}")
-                return [MovieResponse(**movie) for movie in cached_recommendations]
+                logger.debug("Cache hit for recommendations: {}", cache_key)
+                return [MovieResponse.model_construct(**movie) for movie in cached_recommendations]
                 
             # Content-based approach:
             # 1. Get user's highly rated movies
-            logger.debug(f"Fetching user interactions for {user_id}")
+            logger.debug("Fetching user interactions for {}", user_id)
             user_movies = await self.interaction_repo.get_user_interactions(
                 user_id=user_id,
                 limit=10  # Consider only the most recent interactions
             )
             
-            logger.debug(f"Found {len(user_movies)} user interactions")
+            logger.debug("Found {} user interactions", len(user_movies))
             if not user_movies:
                 logger.info(f"No interactions found for user {user_id}, using default recommendations")
                 # Fall back to popular movies
                 return await self._get_default_recommendations(limit)
             
             # Log some details about the interactions found
-            logger.debug(f"User interactions sample: {user_movies[:2]}")
+            logger.debug("User interactions sample: {}", user_movies[:2])
             
             # 2. Get embeddings for user's favorite movies
             movie_scores = {}  # Will store movie_id -> similarity score
             
             # Get movies the user has already seen/rated
             if exclude_seen:
-                logger.debug(f"Fetching movies user {user_id} has already seen")
+                logger.debug("Fetching movies user {} has already seen", user_id)
                 seen_movie_ids = await self.interaction_repo.get_user_movie_ids(user_id)
-                logger.debug(f"User has seen {len(seen_movie_ids)} movies")
+                logger.debug("User has seen {} movies", len(seen_movie_ids))
             else:
                 seen_movie_ids = []
             
@@ -90,10 +100,10 @@ class RecommendationService:
                 # Make sure we have a numeric value
                 if value is None:
                     interaction_weight = 0.6  # Default weight if no value
-                    logger.debug(f"No rating value for movie {movie_id}, using default weight {interaction_weight}")
+                    logger.debug("No rating value for movie {}, using default weight {}", movie_id, interaction_weight)
                 else:
                     interaction_weight = float(value) / 5.0  # Normalize to 0-1
-                logger.debug(f"Processing movie {movie_id} with weight {interaction_weight}")
+                logger.debug("Processing movie {} with weight {}", movie_id, interaction_weight)
                 
                 # Get this movie's embedding
                 source_embedding = await self.movie_repo.get_embedding(movie_id)
@@ -104,9 +114,9 @@ class RecommendationService:
                 # Compare it to other movies
                 # We can optimize this by getting all embeddings at once or using a vector DB
                 # But for now, we'll do it one by one
-                logger.debug(f"Fetching candidate movies to compare with {movie_id}")
+                logger.debug("Fetching candidate movies to compare with {}", movie_id)
                 candidate_movies = await self.movie_repo.get_movies(limit=100)  # Get candidates
-                logger.debug(f"Found {len(candidate_movies)} candidate movies")
+                logger.debug("Found {} candidate movies", len(candidate_movies))
                 
                 for candidate in candidate_movies:
                     candidate_id = str(candidate.get("_id"))
@@ -126,7 +136,7 @@ class RecommendationService:
                     
                     # Calculate similarity
                     try:
-                        similarity = 1 - cosine(source_embedding, candidate_embedding)
+                        similarity = 1 - _cosine(source_embedding, candidate_embedding)
                         
                         # Apply weight from the interaction
                         weighted_similarity = similarity * interaction_weight
@@ -141,7 +151,7 @@ class RecommendationService:
                         continue
             
             # Sort movies by total score
-            logger.debug(f"Calculated scores for {len(movie_scores)} movies")
+            logger.debug("Calculated scores for {} movies", len(movie_scores))
             sorted_movies = sorted(
                 movie_scores.items(), 
                 key=lambda x: x[1], 
@@ -150,13 +160,17 @@ class RecommendationService:
             
             # Get top N movies
             top_movie_ids = [movie_id for movie_id, _ in sorted_movies[:limit]]
-            logger.debug(f"Top movie IDs: {top_movie_ids}")
+            logger.debug("Top movie IDs: {}", top_movie_ids)
             
-            # Get full details for top movies
+            # Get full details for top movies in one query, then restore score order
+            movies_by_id = {
+                str(movie["_id"]): movie
+                for movie in await self.movie_repo.get_by_ids(top_movie_ids)
+            }
             recommendations = []
             for movie_id in top_movie_ids:
                 try:
-                    movie = await self.movie_repo.get_by_id(movie_id)
+                    movie = movies_by_id.get(movie_id)
                     if movie:
                         # Create a properly formatted dict for MovieResponse
                         movie_response_dict = {
@@ -165,15 +179,15 @@ class RecommendationService:
                             "genres": movie["genres"],
                             "year": movie.get("year")  # This field is optional
                         }
-                        recommendations.append(MovieResponse(**movie_response_dict))
+                        recommendations.append(MovieResponse.model_construct(**movie_response_dict))
                 except Exception as e:
                     logger.error(f"Error creating MovieResponse for movie {movie_id}: {e}")
             
-            logger.debug(f"Returning {len(recommendations)} recommendations")
+            logger.debug("Returning {} recommendations", len(recommendations))
             
             # Cache the results
             if recommendations:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [movie.dict() for movie in recommendations],
                     settings.RECOMMENDATIONS_CACHE_TTL
@@ -199,11 +213,17 @@ class RecommendationService:
         try:
             # Check cache first
             cache_key = f"recommendations:similar:{movie_id}:{limit}"
-            cached_recommendations = self.cache_repo.get_json(cache_key)
+            cached_recommendations = await self.cache_repo.get_json(cache_key)
             
             if cached_recommendations:
-                logger.debug(f"Cache hit for similar movies: {cache_key}")
-                return [RecommendationResponse(**rec) for rec in cached_recommendations]
+                logger.debug("Cache hit for similar movies: {}", cache_key)
+                return [
+                    RecommendationResponse.model_construct(
+                        movie=MovieResponse.model_construct(**rec["movie"]),
+                        score=rec["score"]
+                    )
+                    for rec in cached_recommendations
+                ]
             
             # Get the source movie's embedding
             source_embedding = await self.movie_repo.get_embedding(movie_id)
@@ -229,7 +249,7 @@ class RecommendationService:
                 
                 try:
                     # Calculate similarity
-                    similarity = 1 - cosine(source_embedding, candidate_embedding)
+                    similarity = 1 - _cosine(source_embedding, candidate_embedding)
                     similarities.append((candidate_id, similarity))
                 except Exception as e:
                     logger.error(f"Error calculating similarity between {movie_id} and {candidate_id}: {e}")
@@ -241,11 +261,15 @@ class RecommendationService:
             # Get top N movies with their similarity scores
             top_movie_pairs = sorted_similarities[:limit]
             
-            # Get full details for top movies
+            # Get full details for top movies in one query, then restore similarity order
+            movies_by_id = {
+                str(movie["_id"]): movie
+                for movie in await self.movie_repo.get_by_ids([similar_id for similar_id, _ in top_movie_pairs])
+            }
             similar_movies = []
             for similar_id, similarity_score in top_movie_pairs:
                 try:
-                    movie = await self.movie_repo.get_by_id(similar_id)
+                    movie = movies_by_id.get(similar_id)
                     if movie:
                         # Create a properly formatted dict for MovieResponse
                         movie_response_dict = {
@@ -254,10 +278,10 @@ class RecommendationService:
                             "genres": movie["genres"],
                             "year": movie.get("year")  # This field is optional
                         }
-                        movie_response = MovieResponse(**movie_response_dict)
+                        movie_response = MovieResponse.model_construct(**movie_response_dict)
                         
                         # Create Recommendation response with movie and score
-                        recommendation = RecommendationResponse(
+                        recommendation = RecommendationResponse.model_construct(
                             movie=movie_response,
                             score=float(similarity_score)
                         )
@@ -267,7 +291,7 @@ class RecommendationService:
             
             # Cache the results
             if similar_movies:
-                self.cache_repo.set_json(
+                await self.cache_repo.set_json(
                     cache_key,
                     [rec.dict() for rec in similar_movies],
                     settings.RECOMMENDATIONS_CACHE_TTL
@@ -299,7 +323,7 @@ class RecommendationService:
                         "genres": movie["genres"],
                         "year": movie.get("year")  # This field is optional
                     }
-                    recommendations.append(MovieResponse(**movie_response_dict))
+                    recommendations.append(MovieResponse.model_construct(**movie_response_dict))
                 except Exception as e:
                     logger.error(f"Error creating MovieResponse for default recommendation: {e}")
             
@@ -323,10 +347,10 @@ class RecommendationService:
             # Try to get from cache first
             cache_key = f"movies:popular:{limit}"
             try:
-                cached_data = self.cache_repo.get_json(cache_key)
+                cached_data = await self.cache_repo.get_json(cache_key)
                 if cached_data:
-                    logger.debug(f"Cache hit for {cache_key}")
-                    return [MovieResponse(**movie) for movie in cached_data]
+                    logger.debug("Cache hit for {}", cache_key)
+                    return [MovieResponse.model_construct(**movie) for movie in cached_data]
             except Exception as cache_error:
                 logger.warning(f"Cache error in get_popular_movies: {cache_error}, proceeding without cache")
             
@@ -358,7 +382,7 @@ class RecommendationService:
                     # Fetch movie details
                     cursor = db.movies.find(
                         {"_id": {"$in": movie_ids}},
-                        {"embedding": 0}
+                        _NO_EMBEDDING_PROJECTION
                     ).limit(limit)
                     
                     movies_data = await cursor.to_list(length=limit)
@@ -380,7 +404,7 @@ class RecommendationService:
                                     "poster_url": self._get_full_poster_url(movie.get("poster_path")),
                                     "backdrop_url": self._get_full_backdrop_url(movie.get("backdrop_path"))
                                 }
-                                movie_response = MovieResponse(**movie_dict)
+                                movie_response = MovieResponse.model_construct(**movie_dict)
                                 movies.append(movie_response)
                             except Exception as e:
                                 logger.error(f"Error creating MovieResponse in get_popular_movies: {e}")
@@ -388,7 +412,7 @@ class RecommendationService:
                         # Try to cache the result
                         try:
                             if movies:
-                                self.cache_repo.set_json(
+                                await self.cache_repo.set_json(
                                     cache_key,
                                     [movie.dict() for movie in movies],
                                     settings.RECOMMENDATIONS_CACHE_TTL
@@ -438,9 +462,9 @@ async def get_user_recommendations(user_id: str, limit: int = 10) -> List[Dict[s
     cache_key = f"rec:{user_id}"
     if redis_client:
         try:
-            cached_recs = redis_client.get(cache_key)
+            cached_recs = await redis_client.get(cache_key)
             if cached_recs:
-                logger.debug(f"Cache hit for user recommendations: {user_id}")
+                logger.debug("Cache hit for user recommendations: {}", user_id)
                 return json.loads(cached_recs)
         except Exception as e:
             logger.warning(f"Redis error in get_user_recommendations: {e}")
@@ -511,7 +535,7 @@ async def get_user_recommendations(user_id: str, limit: int = 10) -> List[Dict[s
     # Cache the results
     if redis_client:
         try:
-            redis_client.setex(
+            await redis_client.setex(
                 cache_key,
                 settings.RECOMMENDATIONS_CACHE_TTL,
                 json.dumps(top_recommendations, default=str)
@@ -534,7 +558,7 @@ async def get_popular_movies(limit: int = 10) -> List[Dict[str, Any]]:
     cache_key = f"movies:popular:{limit}"
     if redis_client:
         try:
-            cached_popular = redis_client.get(cache_key)
+            cached_popular = await redis_client.get(cache_key)
             if cached_popular:
                 return json.loads(cached_popular)
         except Exception as e:
@@ -562,14 +586,14 @@ async def get_popular_movies(limit: int = 10) -> List[Dict[str, Any]]:
         
         if not movie_ids:
             # Fallback: just get recent movies if no interactions exist
-            cursor = db.movies.find({}, {"embedding": 0}).sort("_id", -1).limit(limit)
+            cursor = db.movies.find({}, _NO_EMBEDDING_PROJECTION).sort("_id", -1).limit(limit)
             movies = await cursor.to_list(length=limit)
             return movies
         
         # Fetch movie details (excluding embeddings to save memory)
         cursor = db.movies.find(
             {"_id": {"$in": movie_ids}},
-            {"embedding": 0}
+            _NO_EMBEDDING_PROJECTION
         ).limit(limit)
         
         movies = await cursor.to_list(length=limit)
@@ -577,7 +601,7 @@ async def get_popular_movies(limit: int = 10) -> List[Dict[str, Any]]:
         # Cache the results
         if redis_client and movies:
             try:
-                redis_client.setex(
+                await redis_client.setex(
                     cache_key,
                     settings.RECOMMENDATIONS_CACHE_TTL,
                     json.dumps(movies, default=str)
@@ -590,7 +614,7 @@ async def get_popular_movies(limit: int = 10) -> List[Dict[str, Any]]:
         logger.error(f"Error getting popular movies: {e}")
         # Fallback to simple query if aggregation fails
         try:
-            cursor = db.movies.find({}, {"embedding": 0}).limit(limit)
+            cursor = db.movies.find({}, _NO_EMBEDDING_PROJECTION).limit(limit)
             return await cursor.to_list(length=limit)
         except Exception as fallback_error:
             logger.error(f"Error in fallback for popular movies: {fallback_error}")
@@ -607,7 +631,7 @@ async def get_similar_movies(movie_id: str, limit: int = 10) -> List[Dict[str, A
     # Check Redis cache
     cache_key = f"similar:{movie_id}:{limit}"
     if redis_client:
-        cached_similar = redis_client.get(cache_key)
+        cached_similar = await redis_client.get(cache_key)
         if cached_similar:
             return json.loads(cached_similar)
     
@@ -625,7 +649,7 @@ async def get_similar_movies(movie_id: str, limit: int = 10) -> List[Dict[str, A
     # In production, this would use a vector DB or pre-computed similarities
     cursor = db.movies.find(
         {"_id": {"$ne": ObjectId(movie_id)}},
-        {"embedding": 1, "title": 1, "genres": 1, "movieId_ml": 1}
+        _CANDIDATE_PROJECTION
     ).limit(100)  # Limit to avoid loading too many embeddings
     
     candidate_movies = await cursor.to_list(length=100)
@@ -634,10 +658,11 @@ async def get_similar_movies(movie_id: str, limit: int = 10) -> List[Dict[str, A
     similar_movies = []
     
     for candidate in candidate_movies:
-        if "embedding" not in candidate:
+        candidate_embedding = decode_embedding(candidate)
+        if candidate_embedding is None:
             continue
             
-        candidate_embedding = np.array(candidate["embedding"])
+        candidate_embedding = np.array(candidate_embedding)
         
         # Calculate cosine similarity
         similarity = np.dot(movie_embedding_np, candidate_embedding) / (
@@ -645,8 +670,7 @@ async def get_similar_movies(movie_id: str, limit: int = 10) -> List[Dict[str, A
         )
         
         # Remove embedding to save space
-        movie_dict = dict(candidate)
-        del movie_dict["embedding"]
+        movie_dict = {k: v for k, v in candidate.items() if k not in EMBEDDING_FIELDS}
         
         similar_movies.append({
             "movie": movie_dict,
@@ -659,7 +683,7 @@ async def get_similar_movies(movie_id: str, limit: int = 10) -> List[Dict[str, A
     
     # Cache the results
     if redis_client:
-        redis_client.setex(
+        await redis_client.setex(
             cache_key,
             settings.RECOMMENDATIONS_CACHE_TTL,
             json.dumps(top_similar, default=str)
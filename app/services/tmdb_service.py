@@ -1,4 +1,3 @@
-import os
 import httpx
 import re
 import time
@@ -11,9 +10,9 @@ class TMDBService:
     """Service for The Movie Database (TMDB) API integration"""
     
     def __init__(self):
-        self.api_key = os.getenv("TMDB_API_KEY")
-        self.base_url = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")
-        self.image_base_url = os.getenv("TMDB_IMAGE_BASE_URL", "https://image.tmdb.org/t/p/w500")
+        self.api_key = settings.TMDB_API_KEY
+        self.base_url = settings.TMDB_BASE_URL
+        self.image_base_url = settings.TMDB_IMAGE_BASE_URL
         self.retry_attempts = 3
         self.retry_delay = 1  # Initial retry delay in seconds
         self.rate_limit_delay = 0.25  # 250ms between requests to respect rate limits
@@ -123,7 +122,7 @@ class TMDBService:
             
             # Check if we have results
             if not data or not data.get("results") or len(data["results"]) == 0:
-                logger.debug(f"No TMDb results for {title}")
+                logger.debug("No TMDb results for {}", title)
                 return None
             
             # Best match is usually the first result
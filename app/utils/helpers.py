@@ -1,5 +1,10 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import re
+import numpy as np
+
+# Movie document fields holding the embedding, either as a float list ("embedding")
+# or int8-quantized bytes with a per-vector scale ("embedding_q", "embedding_scale")
+EMBEDDING_FIELDS = ("embedding", "embedding_q", "embedding_scale")
 
 def normalize_text(text: str) -> str:
     """
@@ -94,4 +99,29 @@ def create_text_for_embedding(movie: Dict[str, Any]) -> str:
     # Combine for embedding input
     text = f"{clean_title}. {genres}"
     
-    return text 
\ No newline at end of file
+    return text 
+
+def decode_embedding(doc: Dict[str, Any]) -> Optional[List[float]]:
+    """
+    Read the embedding vector from a movie document
+    
+    Args:
+        doc: Movie document with either a float "embedding" list or the
+            quantized "embedding_q"/"embedding_scale" fields
+        
+    Returns:
+        Embedding as a list of floats, or None if the document has none
+    """
+    if not doc:
+        return None
+    
+    embedding = doc.get("embedding")
+    if embedding is not None:
+        return embedding
+    
+    quantized = doc.get("embedding_q")
+    if quantized is None:
+        return None
+    
+    scale = doc.get("embedding_scale", 1.0)
+    return (np.frombuffer(quantized, dtype=np.int8).astype(np.float32) * scale).tolist()
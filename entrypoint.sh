@@ -7,16 +7,18 @@ ls -la
 echo "Python version: $(python --version)"
 echo "Python path:"
 python -c "import sys; print(sys.path)"
-echo "Checking main.py:"
-if [ -f "main.py" ]; then
-    echo "main.py exists"
-    echo "Content of main.py (first few lines):"
-    head -n 10 main.py
+echo "Checking app/main.py:"
+if [ -f "app/main.py" ]; then
+    echo "app/main.py exists"
 else
-    echo "ERROR: main.py does not exist!"
+    echo "ERROR: app/main.py does not exist!"
     echo "Looking for main.py in subdirectories:"
     find . -name "main.py" -type f
 fi
 
+echo "======== INITIALIZING DATABASE ========"
+# Load movie data once, before gunicorn forks its workers
+python -m app.core.init_db || echo "WARNING: database initialization failed, starting the API anyway"
+
 echo "======== STARTING APPLICATION ========"
-exec gunicorn main:app --bind 0.0.0.0:${PORT:-8080} --workers 1 --worker-class uvicorn.workers.UvicornWorker --timeout 60 --log-level debug 
\ No newline at end of file
+exec gunicorn app.main:app -c gunicorn_conf.py 
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+Gunicorn settings for serving the API with uvicorn workers.
+
+Used by entrypoint.sh: gunicorn app.main:app -c gunicorn_conf.py
+
+Movie data is loaded by entrypoint.sh before gunicorn starts, so the workers
+only open connections and never race each other loading the database.
+"""
+import multiprocessing
+import os
+
+# Upper bound on worker processes so each instance stays within its memory budget
+MAX_WORKERS = int(os.getenv("GUNICORN_MAX_WORKERS", "4"))
+
+
+def _default_workers() -> int:
+    """Two workers per CPU, floored at one and capped at MAX_WORKERS"""
+    return max(1, min(2 * multiprocessing.cpu_count(), MAX_WORKERS))
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8080')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", _default_workers()))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+# Heartbeat files on tmpfs so a slow disk can't get workers killed
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+# Workers must not share the app's MongoDB/Redis clients; they're created per
+# process in the FastAPI lifespan, so the app is never loaded before forking
+preload_app = False
@@ -1,7 +1,7 @@
 import pytest
 from httpx import AsyncClient
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
-import redis
+import redis.asyncio as aioredis
 from unittest.mock import AsyncMock, MagicMock
 import asyncio
 from app.main import app
@@ -17,7 +17,7 @@ def mock_mongo_db():
 @pytest.fixture
 def mock_redis():
     """Return a mock Redis client."""
-    return MagicMock(spec=redis.Redis)
+    return AsyncMock(spec=aioredis.Redis)
 
 
 # Override get_database and get_redis dependencies
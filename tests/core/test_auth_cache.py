@@ -0,0 +1,33 @@
+import time
+from app.core.auth_cache import TokenCache
+
+
+def test_token_cache_hit_and_miss():
+    cache = TokenCache()
+    payload = {"sub": "user123", "exp": time.time() + 3600}
+    
+    assert cache.get("token-a") is None
+    cache.set("token-a", payload)
+    
+    assert cache.get("token-a") == payload
+    assert cache.get("token-b") is None
+
+
+def test_token_cache_skips_expired_tokens():
+    cache = TokenCache()
+    cache.set("expired", {"sub": "user123", "exp": time.time() - 1})
+    
+    assert cache.get("expired") is None
+    assert len(cache) == 0
+
+
+def test_token_cache_evicts_least_recently_used():
+    cache = TokenCache(maxsize=2)
+    cache.set("a", {"sub": "a"})
+    cache.set("b", {"sub": "b"})
+    cache.get("a")
+    cache.set("c", {"sub": "c"})
+    
+    assert cache.get("a") == {"sub": "a"}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"sub": "c"}
@@ -0,0 +1,31 @@
+import os
+
+from app.core.config import Settings, _read_dotenv_file
+
+
+def test_dotenv_file_parsed_once_until_changed(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("PROJECT_NAME=First\n")
+    _read_dotenv_file.cache_clear()
+
+    assert Settings(_env_file=env_file).PROJECT_NAME == "First"
+    assert Settings(_env_file=env_file).PROJECT_NAME == "First"
+    assert _read_dotenv_file.cache_info().hits == 1
+
+    env_file.write_text("PROJECT_NAME=Second\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert Settings(_env_file=env_file).PROJECT_NAME == "Second"
+
+
+def test_dotenv_source_keeps_upstream_parse_options(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("PROJECT_NAME=\nTEST_USER_EMAIL=null\n")
+
+    class StrictSettings(Settings):
+        model_config = {**Settings.model_config, "env_ignore_empty": True, "env_parse_none_str": "null"}
+
+    settings = StrictSettings(_env_file=env_file)
+
+    assert settings.PROJECT_NAME == Settings.model_fields["PROJECT_NAME"].default
+    assert settings.TEST_USER_EMAIL is None
@@ -0,0 +1,23 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.middleware import TimingMiddleware
+
+
+def _make_app():
+    app = FastAPI()
+    app.add_middleware(TimingMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def test_timing_header_added():
+    response = TestClient(_make_app()).get("/ping")
+
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert float(response.headers["x-process-time"]) >= 0
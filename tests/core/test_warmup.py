@@ -0,0 +1,17 @@
+from fastapi.testclient import TestClient
+
+from app.core.warmup import warm_up, warm_up_models
+from app.main import app
+
+
+def test_warm_up_fixtures_match_models():
+    # Fails if a model change makes a warm-up fixture invalid
+    warm_up_models()
+
+
+def test_openapi_served_from_cached_bytes():
+    warm_up(app)
+    response = TestClient(app).get(app.openapi_url)
+    assert response.status_code == 200
+    assert response.content == app.state.openapi_bytes
+    assert response.json()["info"]["title"] == app.title
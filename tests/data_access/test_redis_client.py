@@ -0,0 +1,52 @@
+import orjson
+import pytest
+import redis.asyncio as aioredis
+from unittest.mock import AsyncMock, MagicMock
+
+from app.data_access.redis_client import CacheRepository
+
+
+@pytest.fixture
+def mock_redis():
+    return AsyncMock(spec=aioredis.Redis)
+
+
+@pytest.fixture
+def cache_repo(mock_redis):
+    repo = CacheRepository()
+    repo.get_redis = lambda: mock_redis
+    return repo
+
+
+@pytest.mark.asyncio
+async def test_mget_json_decodes_hits_and_misses(cache_repo, mock_redis):
+    mock_redis.mget = AsyncMock(return_value=[orjson.dumps({"id": "1"}), None, b"not json"])
+
+    result = await cache_repo.mget_json(["movies:id:1", "movies:id:2", "movies:id:3"])
+
+    assert result == [{"id": "1"}, None, None]
+    mock_redis.mget.assert_awaited_once_with(["movies:id:1", "movies:id:2", "movies:id:3"])
+
+
+@pytest.mark.asyncio
+async def test_mget_json_without_redis(cache_repo):
+    cache_repo.get_redis = lambda: None
+
+    assert await cache_repo.mget_json(["a", "b"]) == [None, None]
+    assert await cache_repo.mget_json([]) == []
+
+
+@pytest.mark.asyncio
+async def test_mset_json_pipelines_setex(cache_repo, mock_redis):
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[True, True])
+    mock_redis.pipeline = MagicMock()
+    mock_redis.pipeline.return_value.__aenter__.return_value = pipe
+
+    result = await cache_repo.mset_json({"a": {"x": 1}, "b": [1, 2]}, ttl=60)
+
+    assert result is True
+    mock_redis.pipeline.assert_called_once_with(transaction=False)
+    pipe.setex.assert_any_call("a", 60, orjson.dumps({"x": 1}))
+    pipe.setex.assert_any_call("b", 60, orjson.dumps([1, 2]))
+    pipe.execute.assert_awaited_once()
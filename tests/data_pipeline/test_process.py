@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+# process.py is the standalone pipeline script and needs its ML dependencies
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("torch")
+
+from app.data_pipeline.process import MOVIE_INDEXES, _ensure_indexes, _upsert_movie, quantize_embeddings
+from app.utils.helpers import decode_embedding
+
+
+def _apply_update(doc, update):
+    """Apply the $set/$unset parts of an update to an already existing document"""
+    updated = dict(doc)
+    updated.update(update.get("$set", {}))
+    for field in update.get("$unset", {}):
+        updated.pop(field, None)
+    return updated
+
+
+def test_upsert_movie_replaces_legacy_embedding():
+    legacy = {"movieId_ml": 1, "title": "Toy Story", "embedding": [0.9, 0.9, 0.9, 0.9]}
+    values = np.array([[0.5, -0.25, 0.0, 1.0]], dtype=np.float32)
+    (quantized,), (scale,) = quantize_embeddings(values)
+    movie = {
+        "movieId_ml": 1,
+        "title": "Toy Story",
+        "embedding_q": quantized,
+        "embedding_scale": scale,
+        "created_at": datetime.now(timezone.utc),
+    }
+
+    operation = _upsert_movie(movie)
+    assert operation._filter == {"movieId_ml": 1}
+    updated = _apply_update(legacy, operation._doc)
+
+    assert "embedding" not in updated
+    assert np.allclose(decode_embedding(updated), values[0], atol=scale)
+
+
+class _FakeCollection:
+    name = "movies"
+
+    def __init__(self, indexes):
+        self.indexes = indexes
+        self.dropped = []
+        self.created = []
+
+    def index_information(self):
+        return dict(self.indexes)
+
+    def drop_index(self, name):
+        self.dropped.append(name)
+
+    def create_indexes(self, indexes):
+        self.created.extend(index.document["name"] for index in indexes)
+
+
+def test_ensure_indexes_recreates_non_unique_movie_id_index():
+    collection = _FakeCollection({
+        "_id_": {"key": [("_id", 1)]},
+        "movieId_ml_1": {"key": [("movieId_ml", 1)]},
+        "title_text": {"key": [("_fts", "text"), ("_ftsx", 1)]},
+    })
+
+    _ensure_indexes(collection, MOVIE_INDEXES)
+
+    assert collection.dropped == ["movieId_ml_1"]
+    assert collection.created == ["movieId_ml_1"]
+
+
+def test_ensure_indexes_keeps_matching_indexes():
+    collection = _FakeCollection({
+        "movieId_ml_1": {"key": [("movieId_ml", 1)], "unique": True},
+        "title_text": {"key": [("_fts", "text"), ("_ftsx", 1)]},
+    })
+
+    _ensure_indexes(collection, MOVIE_INDEXES)
+
+    assert collection.dropped == []
+    assert collection.created == []
@@ -8,7 +8,7 @@ def movie_service():
     # Create a service with mocked repositories
     service = MovieService()
     service.movie_repo = AsyncMock()
-    service.cache_repo = MagicMock()
+    service.cache_repo = AsyncMock()
     return service
 
 @pytest.mark.asyncio
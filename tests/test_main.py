@@ -0,0 +1,7 @@
+import main
+from app.main import app
+
+
+def test_root_main_reuses_app():
+    # The app, its middleware and routes must only be registered in app/main.py
+    assert main.app is app
@@ -0,0 +1,24 @@
+import numpy as np
+from bson import Binary
+
+from app.utils.helpers import decode_embedding
+
+
+def test_decode_embedding_float_list():
+    assert decode_embedding({"embedding": [0.1, 0.2]}) == [0.1, 0.2]
+
+
+def test_decode_embedding_quantized():
+    values = np.array([0.5, -0.25, 0.0, 1.0], dtype=np.float32)
+    scale = float(np.max(np.abs(values))) / 127.0
+    quantized = np.round(values / scale).astype(np.int8)
+    doc = {"embedding_q": Binary(quantized.tobytes()), "embedding_scale": scale}
+
+    decoded = decode_embedding(doc)
+
+    assert np.allclose(decoded, values, atol=scale)
+
+
+def test_decode_embedding_missing():
+    assert decode_embedding({"title": "Toy Story"}) is None
+    assert decode_embedding(None) is None
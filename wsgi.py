@@ -6,7 +6,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Now import the app
-from main import app as application
+from app.main import app as application
 
 # Make the app available for Gunicorn
 app = application 
\ No newline at end of file